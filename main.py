@@ -13,7 +13,11 @@ Example:
 
 import argparse
 import json
+import math
+import re
 import sys
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 
 # Add project root to path
@@ -21,7 +25,15 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from data.sec_fetcher import fetch_company, CompanyFinancials
 from core.question_generator import QuestionGenerator, DCFAssumptions
-from models.dcf_professional import generate_dcf_model
+
+# Percent answer: "10", "0.10", "10%", "+2.5 %", "-5", "1e-2"
+_PCT_RE = re.compile(r'^\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)\s*(%?)\s*$')
+
+# How each value_type's default is shown in the prompt; others use str()
+_DEFAULT_DISPLAY = {
+    "percent": "{:.1%}".format,
+    "number": "{:.2f}".format,
+}
 
 
 def print_banner():
@@ -36,26 +48,42 @@ def print_banner():
 
 def print_company_summary(fin: CompanyFinancials):
     """Print company financial summary"""
-    print(f"\n{'─'*60}")
-    print(f"  {fin.name} ({fin.ticker})")
-    print(f"{'─'*60}")
+    # Collect lines and emit once rather than one print() per line
+    out = [
+        f"\n{'─'*60}",
+        f"  {fin.name} ({fin.ticker})",
+        f"{'─'*60}",
+    ]
 
     if fin.revenue:
-        print(f"\n  Revenue (last {len(fin.revenue)} years):")
-        for year, rev in zip(fin.revenue_years, fin.revenue):
-            print(f"    {year}: ${rev:,.0f}M")
+        out.append(f"\n  Revenue (last {len(fin.revenue)} years):")
+        out.extend(f"    {year}: ${rev:,.0f}M" for year, rev in zip(fin.revenue_years, fin.revenue))
 
         if fin.revenue_growth:
-            avg_growth = sum(fin.revenue_growth) / len(fin.revenue_growth)
-            print(f"\n  Avg Revenue Growth: {avg_growth:.1%}")
-
-    print(f"  EBITDA Margin: {fin.ebitda_margin:.1%}")
-    print(f"\n  Balance Sheet:")
-    print(f"    Total Debt: ${fin.total_debt:,.0f}M")
-    print(f"    Cash: ${fin.cash:,.0f}M")
-    print(f"    Net Debt: ${fin.total_debt - fin.cash:,.0f}M")
-    print(f"    Shares Outstanding: {fin.shares_outstanding:.1f}M")
-    print(f"{'─'*60}\n")
+            out.append(f"\n  Avg Revenue Growth: {fin.avg_revenue_growth:.1%}")
+
+    out.append(f"  EBITDA Margin: {fin.ebitda_margin:.1%}")
+    out.append(f"\n  Balance Sheet:")
+    out.append(f"    Total Debt: ${fin.total_debt:,.0f}M")
+    out.append(f"    Cash: ${fin.cash:,.0f}M")
+    out.append(f"    Net Debt: ${fin.total_debt - fin.cash:,.0f}M")
+    out.append(f"    Shares Outstanding: {fin.shares_outstanding:.1f}M")
+    out.append(f"{'─'*60}\n")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def parse_percent(text: str) -> float:
+    """Percent answer as a fraction: "10", "10%" and "0.10" all mean 0.10.
+    A bare number above 1 in magnitude is taken as a percent ("-5" is -5%);
+    one within +/-1 as a fraction, so small percents need the "%" ("0.5%").
+    Raises ValueError on anything else."""
+    m = _PCT_RE.match(text)
+    if not m:
+        raise ValueError(f"not a percent: {text!r}")
+    val = float(m.group(1))
+    if m.group(2) or abs(val) > 1:
+        val /= 100
+    return val
 
 
 def interactive_mode(generator: QuestionGenerator) -> dict:
@@ -63,48 +91,41 @@ def interactive_mode(generator: QuestionGenerator) -> dict:
     questions = generator.generate_questions()
     answers = {}
 
-    print("\n" + "="*60)
-    print("  DCF ASSUMPTION QUESTIONNAIRE")
-    print("  Press Enter to accept default, or type new value")
-    print("="*60)
-
-    current_category = None
-
-    for q in questions:
-        if q.category != current_category:
-            current_category = q.category
-            print(f"\n{'─'*40}")
-            print(f"  {current_category}")
-            print(f"{'─'*40}")
-
-        # Format default display
-        if q.value_type == "percent":
-            default_display = f"{q.default_value:.1%}"
-        elif q.value_type == "number":
-            default_display = f"{q.default_value:.2f}"
-        else:
-            default_display = str(q.default_value)
-
-        print(f"\n{q.question}")
-        print(f"  Hint: {q.hint}")
-        user_input = input(f"  [{default_display}]: ").strip()
-
-        if user_input:
-            try:
-                if q.value_type == "percent":
-                    # Handle both "10" and "0.10" and "10%"
-                    user_input = user_input.replace("%", "")
-                    val = float(user_input)
-                    if val > 1:  # User entered "10" meaning 10%
-                        val = val / 100
-                    answers[q.id] = val
-                else:
-                    answers[q.id] = float(user_input)
-            except ValueError:
-                print(f"  Invalid input, using default: {default_display}")
-                answers[q.id] = q.default_value
-        else:
-            answers[q.id] = q.default_value
+    sys.stdout.write("\n".join([
+        "\n" + "="*60,
+        "  DCF ASSUMPTION QUESTIONNAIRE",
+        "  Press Enter to accept default, or type new value",
+        "  Percents: 10, 10% and 0.10 all mean 10%; write 0.5% for small ones",
+        "="*60,
+    ]) + "\n")
+
+    for category, group in groupby(questions, key=attrgetter("category")):
+        sys.stdout.write(f"\n{'─'*40}\n  {category}\n{'─'*40}\n")
+
+        for q in group:
+            show = _DEFAULT_DISPLAY.get(q.value_type, str)
+            default_display = show(q.default_value)
+
+            sys.stdout.write(f"\n{q.question}\n  Hint: {q.hint}\n")
+
+            while True:
+                user_input = input(f"  [{default_display}]: ").strip()
+                if not user_input:
+                    answers[q.id] = q.default_value
+                    break
+                try:
+                    val = parse_percent(user_input) if q.value_type == "percent" else float(user_input)
+                    if not math.isfinite(val):  # float() accepts "nan" and "inf"
+                        raise ValueError(user_input)
+                except ValueError:
+                    print("  Not a number; try again, or press Enter for the default")
+                    continue
+                answers[q.id] = q.clamp(val)  # Keep answers inside the question's range
+                if answers[q.id] != val:
+                    print(f"  {show(val)} is out of range, using {show(answers[q.id])}")
+                elif q.value_type == "percent":
+                    print(f"  Using {show(val)}")
+                break
 
     return answers
 
@@ -114,7 +135,7 @@ def quick_mode(generator: QuestionGenerator) -> dict:
     return generator.get_defaults()
 
 
-def run(ticker: str, output_path: str = None, interactive: bool = False):
+def run(ticker: str, output_path: str = None, interactive: bool = False, writer: str = "openpyxl"):
     """Main execution flow"""
     print_banner()
 
@@ -142,27 +163,30 @@ def run(ticker: str, output_path: str = None, interactive: bool = False):
     # Step 4: Create assumptions object
     assumptions = generator.create_assumptions_from_answers(answers)
 
-    # Step 5: Generate DCF model
+    # Step 5: Generate DCF model (openpyxl is only imported once we get here)
+    from models.dcf_professional import generate_dcf_model
+
     if not output_path:
         output_path = f"{ticker.lower()}_dcf_model.xlsx"
 
     print(f"\nGenerating DCF model...")
-    output_file = generate_dcf_model(assumptions, output_path)
-
-    print(f"\n{'='*60}")
-    print(f"  SUCCESS!")
-    print(f"  DCF model saved to: {output_file}")
-    print(f"{'='*60}")
+    generate_dcf_model(assumptions, output_path, writer=writer)
 
-    # Print key assumptions used
-    print(f"\n  Key Assumptions Used:")
-    print(f"    Base Revenue: ${assumptions.base_revenue:,.0f}M")
-    print(f"    EBITDA Margin: {assumptions.ebitda_margin:.1%}")
-    print(f"    WACC: {assumptions.risk_free_rate + assumptions.beta * assumptions.equity_risk_premium:.1%} (calculated)")
-    print(f"    Terminal Growth: {assumptions.terminal_growth:.1%}")
-    print(f"    Exit Multiple: {assumptions.exit_multiple:.1f}x EV/EBITDA")
+    # Success banner + key assumptions used, emitted in one write
+    sys.stdout.write("\n".join([
+        f"\n{'='*60}",
+        f"  SUCCESS!",
+        f"  DCF model saved to: {output_path}",
+        f"{'='*60}",
+        f"\n  Key Assumptions Used:",
+        f"    Base Revenue: ${assumptions.base_revenue:,.0f}M",
+        f"    EBITDA Margin: {assumptions.ebitda_margin:.1%}",
+        f"    WACC: {assumptions.wacc:.1%} (calculated)",
+        f"    Terminal Growth: {assumptions.terminal_growth:.1%}",
+        f"    Exit Multiple: {assumptions.exit_ebitda_multiple:.1f}x EV/EBITDA",
+    ]) + "\n")
 
-    return output_file
+    return output_path
 
 
 def main():
@@ -181,13 +205,16 @@ Examples:
     parser.add_argument("-o", "--output", help="Output Excel file path")
     parser.add_argument("-i", "--interactive", action="store_true",
                         help="Run in interactive mode with Q&A")
+    parser.add_argument("--writer", choices=["openpyxl", "xlsxwriter", "xml"], default="openpyxl",
+                        help="Excel writer backend (default: openpyxl)")
 
     args = parser.parse_args()
 
     result = run(
         ticker=args.ticker.upper(),
         output_path=args.output,
-        interactive=args.interactive
+        interactive=args.interactive,
+        writer=args.writer
     )
 
     if result:
@@ -0,0 +1,83 @@
+"""
+DCF Projection Kernel
+Year-by-year projection, FCF discounting and terminal value on plain floats
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence
+
+
+@dataclass(slots=True)
+class DCFProjection:
+    """Projected financials (Base + 5 years) and resulting enterprise values"""
+    revenues: List[float]
+    ebitdas: List[float]
+    fcfs: List[float]
+    pv_fcfs: List[float]  # Years 1-5 only
+
+    # Terminal Value
+    tv_gordon: float
+    tv_exit: float
+    pv_tv_gordon: float
+    pv_tv_exit: float
+
+    # Enterprise Value
+    ev_gordon: float
+    ev_exit: float
+
+
+def project(base_revenue: float, growth_rates: Sequence[float],
+            base_margin: float, terminal_margin: float,
+            da_pct: float, capex_pct: float, tax_rate: float, nwc_pct: float,
+            wacc: float, terminal_growth: float, exit_multiple: float,
+            mid_year: bool) -> DCFProjection:
+    """Project revenue -> EBITDA -> unlevered FCF and discount to enterprise value"""
+    years = len(growth_rates)
+
+    # EBITDA margin moves linearly from base to terminal
+    margin_delta = (terminal_margin - base_margin) / years
+    after_tax = 1 - tax_rate
+    discount = 1 + wacc
+    half_year = 0.5 if mid_year else 0  # Mid-year convention shifts each period back
+
+    # Base year: no prior revenue to grow from and nothing to discount
+    rev = base_revenue
+    ebitda = rev * base_margin
+    da = rev * da_pct
+    revenues = [rev]
+    ebitdas = [ebitda]
+    fcfs = [(ebitda - da) * after_tax + da - rev * capex_pct]
+    pv_fcfs = []
+
+    # Years 1..N in one pass; each year only needs the prior year's revenue
+    for year, g in enumerate(growth_rates, 1):
+        prev_rev, rev = rev, rev * (1 + g)
+        ebitda = rev * (base_margin + margin_delta * year)
+        da = rev * da_pct
+        # NOPAT + D&A - capex - change in NWC
+        fcf = (ebitda - da) * after_tax + da - rev * capex_pct - (rev - prev_rev) * nwc_pct
+        revenues.append(rev)
+        ebitdas.append(ebitda)
+        fcfs.append(fcf)
+        pv_fcfs.append(fcf * (1 / discount ** (year - half_year)))
+
+    sum_pv_fcf = sum(pv_fcfs)
+
+    # Terminal values
+    tv_gordon = fcfs[-1] * (1 + terminal_growth) / (wacc - terminal_growth)
+    tv_exit = ebitdas[-1] * exit_multiple
+    pv_tv_gordon = tv_gordon / discount ** years
+    pv_tv_exit = tv_exit / discount ** years
+
+    return DCFProjection(
+        revenues=revenues,
+        ebitdas=ebitdas,
+        fcfs=fcfs,
+        pv_fcfs=pv_fcfs,
+        tv_gordon=tv_gordon,
+        tv_exit=tv_exit,
+        pv_tv_gordon=pv_tv_gordon,
+        pv_tv_exit=pv_tv_exit,
+        ev_gordon=sum_pv_fcf + pv_tv_gordon,
+        ev_exit=sum_pv_fcf + pv_tv_exit,
+    )
@@ -3,12 +3,14 @@ DCF Assumption Question Generator
 Generates comprehensive IB-quality questions based on pulled company data
 """
 
+import math
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from data.sec_fetcher import CompanyFinancials
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DCFQuestion:
     """A question for the analyst to answer"""
     id: str
@@ -18,11 +20,25 @@ class DCFQuestion:
     default_value: Any
     value_type: str  # 'percent', 'number', 'currency', 'years', 'multiple'
     hint: str
-    min_value: Optional[float] = None
-    max_value: Optional[float] = None
+    bounds: Tuple[float, float] = (-math.inf, math.inf)  # (min, max); +/-inf when unbounded
 
+    @property
+    def min_value(self) -> Optional[float]:
+        lo = self.bounds[0]
+        return None if lo == -math.inf else lo
 
-@dataclass
+    @property
+    def max_value(self) -> Optional[float]:
+        hi = self.bounds[1]
+        return None if hi == math.inf else hi
+
+    def clamp(self, value: float) -> float:
+        """Pull an answer back inside this question's bounds"""
+        lo, hi = self.bounds
+        return min(max(value, lo), hi)
+
+
+@dataclass(frozen=True, slots=True)
 class DCFAssumptions:
     """Collected assumptions for DCF model - comprehensive IB quality"""
     # Company Info
@@ -81,18 +97,141 @@ class DCFAssumptions:
     use_mid_year_convention: bool = True
     projection_years: int = 5
 
+    @property
+    def levered_beta(self) -> float:
+        """Unlevered beta relevered at the target D/E (Hamada)"""
+        return self.unlevered_beta * (1 + (1 - self.tax_rate) * self.target_debt_to_equity)
+
+    @property
+    def cost_of_equity(self) -> float:
+        """CAPM on the levered beta plus size and company-specific premiums"""
+        return (self.risk_free_rate + self.levered_beta * self.equity_risk_premium +
+                self.size_premium + self.company_specific_risk)
+
+    @property
+    def after_tax_cost_of_debt(self) -> float:
+        return self.pre_tax_cost_of_debt * (1 - self.tax_rate)
+
+    @property
+    def debt_weight(self) -> float:
+        """Debt / total capital at the target D/E"""
+        return self.target_debt_to_equity / (1 + self.target_debt_to_equity)
+
+    @property
+    def wacc(self) -> float:
+        """WACC from the full buildup - relevered beta CAPM + premiums, after-tax debt"""
+        debt_weight = self.debt_weight
+        return (1 - debt_weight) * self.cost_of_equity + debt_weight * self.after_tax_cost_of_debt
+
+
+# Default Y1-Y5 growth: historical average decayed toward maturity, then capped
+_GROWTH_FACTORS = (0.9, 0.80, 0.65, 0.50, 0.40)
+_GROWTH_CAPS = (0.20, 0.15, 0.12, 0.08, 0.05)
+
+# Assumptions no question asks about (yet)
+_OTHER_WORKING_CAPITAL_PCT = 0.02
+_PREFERRED_STOCK = 0
+
+def _spec(qid, category, subcategory, question, default, value_type, hint, bounds) -> tuple:
+    """One _QUESTION_SPECS row. The repeated labels are interned, so every question
+    shares one string object per category/subcategory/value_type (cheap
+    identity-first compares when grouping)"""
+    return (qid, sys.intern(category), sys.intern(subcategory), question,
+            default, sys.intern(value_type), hint, bounds)
+
+
+# Static question metadata, in display order. Fields follow DCFQuestion:
+# (id, category, subcategory, question, default_value, value_type, hint,
+#  bounds). A None default/hint is filled in per company. Keep each category
+# (and subcategory within it) contiguous: callers groupby() the questions.
+_QUESTION_SPECS: Tuple[tuple, ...] = (
+    # ============ REVENUE PROJECTIONS ============
+    _spec("revenue_growth_y1", "Revenue Build", "Growth Rates", "Year 1 Revenue Growth",
+          None, "percent", None, (-0.20, 0.50)),
+    _spec("revenue_growth_y2", "Revenue Build", "Growth Rates", "Year 2 Revenue Growth",
+          None, "percent", "Deceleration as base grows", (-0.20, 0.40)),
+    _spec("revenue_growth_y3", "Revenue Build", "Growth Rates", "Year 3 Revenue Growth",
+          None, "percent", "Approaching maturity", (-0.15, 0.30)),
+    _spec("revenue_growth_y4", "Revenue Build", "Growth Rates", "Year 4 Revenue Growth",
+          None, "percent", "Near terminal growth", (-0.10, 0.25)),
+    _spec("revenue_growth_y5", "Revenue Build", "Growth Rates", "Year 5 Revenue Growth",
+          None, "percent", "Final projection year", (-0.10, 0.20)),
+
+    # ============ MARGINS ============
+    _spec("ebitda_margin", "Operating Model", "Margins", "Base EBITDA Margin",
+          None, "percent", None, (0.05, 0.60)),
+    _spec("ebitda_margin_y5", "Operating Model", "Margins", "Terminal EBITDA Margin (Y5)",
+          None, "percent", "Margin expansion/contraction over forecast", (0.05, 0.60)),
+    _spec("sbc_pct_revenue", "Operating Model", "Margins", "Stock-Based Comp (% Rev)",
+          0.08, "percent", "Tech companies: 5-15%. Add back for EBITDA, real cash cost.", (0.0, 0.25)),
+
+    # ============ D&A / CAPEX ============
+    _spec("da_pct_revenue", "Operating Model", "D&A / CapEx", "D&A (% of Revenue)",
+          0.04, "percent", "Software: 3-5%, Hardware: 5-10%", (0.01, 0.15)),
+    _spec("capex_pct_revenue", "Operating Model", "D&A / CapEx", "Total CapEx (% of Revenue)",
+          0.05, "percent", "Maintenance + Growth CapEx", (0.01, 0.20)),
+    _spec("maintenance_capex_pct", "Operating Model", "D&A / CapEx", "Maintenance CapEx (% of Total)",
+          0.60, "percent", "Rest is growth CapEx. Maintenance ≈ D&A at steady state.", (0.30, 1.0)),
+
+    # ============ WORKING CAPITAL ============
+    _spec("days_sales_outstanding", "Working Capital", "Receivables", "Days Sales Outstanding (DSO)",
+          None, "number", "AR collection period. SaaS: 30-45, Enterprise: 45-90", (15, 120)),
+    _spec("days_inventory_outstanding", "Working Capital", "Inventory", "Days Inventory Outstanding (DIO)",
+          None, "number", "Software: ~0, Hardware: 30-90", (0, 180)),
+    _spec("days_payables_outstanding", "Working Capital", "Payables", "Days Payables Outstanding (DPO)",
+          None, "number", "AP payment period. Higher = better cash conversion.", (15, 120)),
+
+    # ============ TAX ============
+    _spec("tax_rate", "Tax", "Effective Rate", "Effective Tax Rate",
+          0.24, "percent", "Federal 21% + State ~3%. Check for NOLs.", (0.0, 0.40)),
+    _spec("nol_balance", "Tax", "NOLs", "NOL Balance ($M)",
+          0, "currency", "Net Operating Loss carryforwards. Check 10-K.", (0, 10000)),
+
+    # ============ WACC BUILDUP ============
+    _spec("risk_free_rate", "WACC", "Cost of Equity", "Risk-Free Rate (10Y UST)",
+          0.043, "percent", "Current 10Y Treasury yield", (0.01, 0.10)),
+    _spec("equity_risk_premium", "WACC", "Cost of Equity", "Equity Risk Premium",
+          0.055, "percent", "Duff & Phelps: 5.5%. Historical: 5-7%", (0.03, 0.10)),
+    _spec("unlevered_beta", "WACC", "Cost of Equity", "Unlevered Beta",
+          None, "number", "From comps. Unlever at comp D/E, relever at target.", (0.5, 2.0)),
+    _spec("size_premium", "WACC", "Cost of Equity", "Size Premium",
+          0.01, "percent", "Small cap: 2-4%, Mid cap: 0-2%, Large: 0%", (0.0, 0.06)),
+    _spec("company_specific_risk", "WACC", "Cost of Equity", "Company-Specific Risk Premium",
+          0.01, "percent", "Execution risk, key man, customer concentration", (0.0, 0.05)),
+    _spec("pre_tax_cost_of_debt", "WACC", "Cost of Debt", "Pre-Tax Cost of Debt",
+          0.065, "percent", "Based on credit rating. IG: 5-7%, HY: 8-12%", (0.03, 0.15)),
+    _spec("target_debt_to_equity", "WACC", "Capital Structure", "Target Debt / Equity",
+          0.25, "number", "For relevering beta and WACC weights", (0.0, 2.0)),
+
+    # ============ TERMINAL VALUE ============
+    _spec("terminal_growth", "Terminal Value", "Perpetuity", "Perpetuity Growth Rate",
+          0.025, "percent", "Cannot exceed long-term GDP (2-3%)", (0.0, 0.04)),
+    _spec("exit_ebitda_multiple", "Terminal Value", "Exit Multiples", "Exit EV/EBITDA Multiple",
+          12.0, "multiple", "From trading comps. Software: 12-20x, Media: 8-12x", (4.0, 30.0)),
+    _spec("exit_revenue_multiple", "Terminal Value", "Exit Multiples", "Exit EV/Revenue Multiple",
+          3.0, "multiple", "Cross-check. High-growth SaaS: 5-10x, Mature: 1-3x", (0.5, 15.0)),
+
+    # ============ CAPITAL STRUCTURE ============
+    _spec("minority_interest", "EV Bridge", "Adjustments", "Minority Interest ($M)",
+          0, "currency", "Non-controlling interests. Check balance sheet.", (0, 50000)),
+    _spec("options_dilution", "EV Bridge", "Share Count", "Options/RSU Dilution (%)",
+          0.03, "percent", "Treasury stock method dilution. Tech: 3-8%", (0.0, 0.15)),
+)
+
 
 class QuestionGenerator:
     """Generate comprehensive DCF assumption questions based on company data"""
 
     def __init__(self, financials: CompanyFinancials):
         self.fin = financials
+        self._questions: Optional[List[DCFQuestion]] = None  # Built once, reused
+        self._hist_growth_str = ", ".join(f"{g:.1%}" for g in financials.revenue_growth[-3:])
 
     def _calc_avg_growth(self) -> float:
         """Calculate average historical revenue growth"""
         if not self.fin.revenue_growth:
             return 0.05
-        return sum(self.fin.revenue_growth) / len(self.fin.revenue_growth)
+        return self.fin.avg_revenue_growth
 
     def _calc_implied_beta(self) -> float:
         """Estimate unlevered beta based on company characteristics"""
@@ -118,403 +257,116 @@ class QuestionGenerator:
         """Estimate DPO"""
         return 35.0
 
-    def generate_questions(self) -> List[DCFQuestion]:
-        """Generate all DCF assumption questions - comprehensive set"""
+    def _dynamic_defaults(self) -> Dict[str, Any]:
+        """Defaults that depend on company data; the rest are static in _QUESTION_SPECS"""
         avg_growth = self._calc_avg_growth()
-        implied_beta = self._calc_implied_beta()
-        net_debt = self.fin.total_debt - self.fin.cash
+        margin = self.fin.ebitda_margin
+        growth = [min(avg_growth * f, cap) for f, cap in zip(_GROWTH_FACTORS, _GROWTH_CAPS)]
+
+        return {
+            "revenue_growth_y1": growth[0],
+            "revenue_growth_y2": growth[1],
+            "revenue_growth_y3": growth[2],
+            "revenue_growth_y4": growth[3],
+            "revenue_growth_y5": growth[4],
+            "ebitda_margin": max(margin, 0.10) if margin < 0.80 else 0.25,
+            "ebitda_margin_y5": min(max(margin, 0.10) + 0.03, 0.40) if margin < 0.80 else 0.28,
+            "days_sales_outstanding": self._estimate_dso(),
+            "days_inventory_outstanding": self._estimate_dio(),
+            "days_payables_outstanding": self._estimate_dpo(),
+            "unlevered_beta": self._calc_implied_beta(),
+        }
+
+    def _iter_question_defaults(self) -> Iterator[Tuple[str, Any]]:
+        """Yield (id, default_value) per question without building DCFQuestion objects"""
+        dynamic_defaults = self._dynamic_defaults()
+        for spec in _QUESTION_SPECS:
+            qid = spec[0]
+            yield qid, dynamic_defaults.get(qid, spec[4])
+
+    def generate_questions(self) -> List[DCFQuestion]:
+        """Generate all DCF assumption questions - comprehensive set, grouped by category"""
+        if self._questions is not None:
+            return self._questions
+
+        dynamic_defaults = self._dynamic_defaults()
+        dynamic_hints = {
+            "revenue_growth_y1": f"Historical: [{self._hist_growth_str}]",
+            "ebitda_margin": f"Current: {self.fin.ebitda_margin:.1%}",
+        }
 
         questions = [
-            # ============ REVENUE PROJECTIONS ============
-            DCFQuestion(
-                id="revenue_growth_y1",
-                category="Revenue Build",
-                subcategory="Growth Rates",
-                question=f"Year 1 Revenue Growth",
-                default_value=min(avg_growth * 0.9, 0.20),
-                value_type="percent",
-                hint=f"Historical: {[f'{g:.1%}' for g in self.fin.revenue_growth[-3:]]}",
-                min_value=-0.20,
-                max_value=0.50
-            ),
-            DCFQuestion(
-                id="revenue_growth_y2",
-                category="Revenue Build",
-                subcategory="Growth Rates",
-                question="Year 2 Revenue Growth",
-                default_value=min(avg_growth * 0.80, 0.15),
-                value_type="percent",
-                hint="Deceleration as base grows",
-                min_value=-0.20,
-                max_value=0.40
-            ),
-            DCFQuestion(
-                id="revenue_growth_y3",
-                category="Revenue Build",
-                subcategory="Growth Rates",
-                question="Year 3 Revenue Growth",
-                default_value=min(avg_growth * 0.65, 0.12),
-                value_type="percent",
-                hint="Approaching maturity",
-                min_value=-0.15,
-                max_value=0.30
-            ),
-            DCFQuestion(
-                id="revenue_growth_y4",
-                category="Revenue Build",
-                subcategory="Growth Rates",
-                question="Year 4 Revenue Growth",
-                default_value=min(avg_growth * 0.50, 0.08),
-                value_type="percent",
-                hint="Near terminal growth",
-                min_value=-0.10,
-                max_value=0.25
-            ),
-            DCFQuestion(
-                id="revenue_growth_y5",
-                category="Revenue Build",
-                subcategory="Growth Rates",
-                question="Year 5 Revenue Growth",
-                default_value=min(avg_growth * 0.40, 0.05),
-                value_type="percent",
-                hint="Final projection year",
-                min_value=-0.10,
-                max_value=0.20
-            ),
-
-            # ============ MARGINS ============
-            DCFQuestion(
-                id="ebitda_margin",
-                category="Operating Model",
-                subcategory="Margins",
-                question=f"Base EBITDA Margin",
-                default_value=max(self.fin.ebitda_margin, 0.10) if self.fin.ebitda_margin < 0.80 else 0.25,
-                value_type="percent",
-                hint=f"Current: {self.fin.ebitda_margin:.1%}",
-                min_value=0.05,
-                max_value=0.60
-            ),
-            DCFQuestion(
-                id="ebitda_margin_y5",
-                category="Operating Model",
-                subcategory="Margins",
-                question="Terminal EBITDA Margin (Y5)",
-                default_value=min(max(self.fin.ebitda_margin, 0.10) + 0.03, 0.40) if self.fin.ebitda_margin < 0.80 else 0.28,
-                value_type="percent",
-                hint="Margin expansion/contraction over forecast",
-                min_value=0.05,
-                max_value=0.60
-            ),
-            DCFQuestion(
-                id="sbc_pct_revenue",
-                category="Operating Model",
-                subcategory="Margins",
-                question="Stock-Based Comp (% Rev)",
-                default_value=0.08,
-                value_type="percent",
-                hint="Tech companies: 5-15%. Add back for EBITDA, real cash cost.",
-                min_value=0.0,
-                max_value=0.25
-            ),
-
-            # ============ D&A / CAPEX ============
-            DCFQuestion(
-                id="da_pct_revenue",
-                category="Operating Model",
-                subcategory="D&A / CapEx",
-                question="D&A (% of Revenue)",
-                default_value=0.04,
-                value_type="percent",
-                hint="Software: 3-5%, Hardware: 5-10%",
-                min_value=0.01,
-                max_value=0.15
-            ),
-            DCFQuestion(
-                id="capex_pct_revenue",
-                category="Operating Model",
-                subcategory="D&A / CapEx",
-                question="Total CapEx (% of Revenue)",
-                default_value=0.05,
-                value_type="percent",
-                hint="Maintenance + Growth CapEx",
-                min_value=0.01,
-                max_value=0.20
-            ),
-            DCFQuestion(
-                id="maintenance_capex_pct",
-                category="Operating Model",
-                subcategory="D&A / CapEx",
-                question="Maintenance CapEx (% of Total)",
-                default_value=0.60,
-                value_type="percent",
-                hint="Rest is growth CapEx. Maintenance ≈ D&A at steady state.",
-                min_value=0.30,
-                max_value=1.0
-            ),
-
-            # ============ WORKING CAPITAL ============
-            DCFQuestion(
-                id="days_sales_outstanding",
-                category="Working Capital",
-                subcategory="Receivables",
-                question="Days Sales Outstanding (DSO)",
-                default_value=self._estimate_dso(),
-                value_type="number",
-                hint="AR collection period. SaaS: 30-45, Enterprise: 45-90",
-                min_value=15,
-                max_value=120
-            ),
-            DCFQuestion(
-                id="days_inventory_outstanding",
-                category="Working Capital",
-                subcategory="Inventory",
-                question="Days Inventory Outstanding (DIO)",
-                default_value=self._estimate_dio(),
-                value_type="number",
-                hint="Software: ~0, Hardware: 30-90",
-                min_value=0,
-                max_value=180
-            ),
-            DCFQuestion(
-                id="days_payables_outstanding",
-                category="Working Capital",
-                subcategory="Payables",
-                question="Days Payables Outstanding (DPO)",
-                default_value=self._estimate_dpo(),
-                value_type="number",
-                hint="AP payment period. Higher = better cash conversion.",
-                min_value=15,
-                max_value=120
-            ),
-
-            # ============ TAX ============
-            DCFQuestion(
-                id="tax_rate",
-                category="Tax",
-                subcategory="Effective Rate",
-                question="Effective Tax Rate",
-                default_value=0.24,
-                value_type="percent",
-                hint="Federal 21% + State ~3%. Check for NOLs.",
-                min_value=0.0,
-                max_value=0.40
-            ),
-            DCFQuestion(
-                id="nol_balance",
-                category="Tax",
-                subcategory="NOLs",
-                question="NOL Balance ($M)",
-                default_value=0,
-                value_type="currency",
-                hint="Net Operating Loss carryforwards. Check 10-K.",
-                min_value=0,
-                max_value=10000
-            ),
-
-            # ============ WACC BUILDUP ============
-            DCFQuestion(
-                id="risk_free_rate",
-                category="WACC",
-                subcategory="Cost of Equity",
-                question="Risk-Free Rate (10Y UST)",
-                default_value=0.043,
-                value_type="percent",
-                hint="Current 10Y Treasury yield",
-                min_value=0.01,
-                max_value=0.10
-            ),
-            DCFQuestion(
-                id="equity_risk_premium",
-                category="WACC",
-                subcategory="Cost of Equity",
-                question="Equity Risk Premium",
-                default_value=0.055,
-                value_type="percent",
-                hint="Duff & Phelps: 5.5%. Historical: 5-7%",
-                min_value=0.03,
-                max_value=0.10
-            ),
-            DCFQuestion(
-                id="unlevered_beta",
-                category="WACC",
-                subcategory="Cost of Equity",
-                question=f"Unlevered Beta",
-                default_value=implied_beta,
-                value_type="number",
-                hint="From comps. Unlever at comp D/E, relever at target.",
-                min_value=0.5,
-                max_value=2.0
-            ),
-            DCFQuestion(
-                id="size_premium",
-                category="WACC",
-                subcategory="Cost of Equity",
-                question="Size Premium",
-                default_value=0.01,
-                value_type="percent",
-                hint="Small cap: 2-4%, Mid cap: 0-2%, Large: 0%",
-                min_value=0.0,
-                max_value=0.06
-            ),
-            DCFQuestion(
-                id="company_specific_risk",
-                category="WACC",
-                subcategory="Cost of Equity",
-                question="Company-Specific Risk Premium",
-                default_value=0.01,
-                value_type="percent",
-                hint="Execution risk, key man, customer concentration",
-                min_value=0.0,
-                max_value=0.05
-            ),
-            DCFQuestion(
-                id="pre_tax_cost_of_debt",
-                category="WACC",
-                subcategory="Cost of Debt",
-                question="Pre-Tax Cost of Debt",
-                default_value=0.065,
-                value_type="percent",
-                hint="Based on credit rating. IG: 5-7%, HY: 8-12%",
-                min_value=0.03,
-                max_value=0.15
-            ),
-            DCFQuestion(
-                id="target_debt_to_equity",
-                category="WACC",
-                subcategory="Capital Structure",
-                question="Target Debt / Equity",
-                default_value=0.25,
-                value_type="number",
-                hint="For relevering beta and WACC weights",
-                min_value=0.0,
-                max_value=2.0
-            ),
-
-            # ============ TERMINAL VALUE ============
-            DCFQuestion(
-                id="terminal_growth",
-                category="Terminal Value",
-                subcategory="Perpetuity",
-                question="Perpetuity Growth Rate",
-                default_value=0.025,
-                value_type="percent",
-                hint="Cannot exceed long-term GDP (2-3%)",
-                min_value=0.0,
-                max_value=0.04
-            ),
-            DCFQuestion(
-                id="exit_ebitda_multiple",
-                category="Terminal Value",
-                subcategory="Exit Multiples",
-                question="Exit EV/EBITDA Multiple",
-                default_value=12.0,
-                value_type="multiple",
-                hint="From trading comps. Software: 12-20x, Media: 8-12x",
-                min_value=4.0,
-                max_value=30.0
-            ),
-            DCFQuestion(
-                id="exit_revenue_multiple",
-                category="Terminal Value",
-                subcategory="Exit Multiples",
-                question="Exit EV/Revenue Multiple",
-                default_value=3.0,
-                value_type="multiple",
-                hint="Cross-check. High-growth SaaS: 5-10x, Mature: 1-3x",
-                min_value=0.5,
-                max_value=15.0
-            ),
-
-            # ============ CAPITAL STRUCTURE ============
-            DCFQuestion(
-                id="minority_interest",
-                category="EV Bridge",
-                subcategory="Adjustments",
-                question="Minority Interest ($M)",
-                default_value=0,
-                value_type="currency",
-                hint="Non-controlling interests. Check balance sheet.",
-                min_value=0,
-                max_value=50000
-            ),
-            DCFQuestion(
-                id="options_dilution",
-                category="EV Bridge",
-                subcategory="Share Count",
-                question="Options/RSU Dilution (%)",
-                default_value=0.03,
-                value_type="percent",
-                hint="Treasury stock method dilution. Tech: 3-8%",
-                min_value=0.0,
-                max_value=0.15
-            ),
+            DCFQuestion(qid, category, subcategory, question,
+                        dynamic_defaults.get(qid, default), value_type,
+                        dynamic_hints.get(qid, hint), bounds)
+            for (qid, category, subcategory, question,
+                 default, value_type, hint, bounds) in _QUESTION_SPECS
         ]
 
+        self._questions = questions
         return questions
 
     def create_assumptions_from_answers(self, answers: Dict[str, Any]) -> DCFAssumptions:
         """Create DCFAssumptions from answered questions"""
+        # Unanswered questions fall back to the same defaults the questions show
+        merged = self.get_defaults()
+        merged.update(answers)
 
-        # Calculate NWC from DSO/DIO/DPO
-        dso = answers.get("days_sales_outstanding", 45)
-        dio = answers.get("days_inventory_outstanding", 15)
-        dpo = answers.get("days_payables_outstanding", 35)
-        # Cash conversion cycle as proxy for NWC
-        ccc = dso + dio - dpo
+        fin = self.fin
+        m = merged.__getitem__
 
         return DCFAssumptions(
-            company_name=self.fin.name,
-            ticker=self.fin.ticker,
-            base_revenue=self.fin.revenue[-1] if self.fin.revenue else 0,
-
-            revenue_growth_y1=answers.get("revenue_growth_y1", 0.10),
-            revenue_growth_y2=answers.get("revenue_growth_y2", 0.08),
-            revenue_growth_y3=answers.get("revenue_growth_y3", 0.06),
-            revenue_growth_y4=answers.get("revenue_growth_y4", 0.05),
-            revenue_growth_y5=answers.get("revenue_growth_y5", 0.04),
-
-            ebitda_margin=answers.get("ebitda_margin", self.fin.ebitda_margin if self.fin.ebitda_margin < 0.80 else 0.25),
-            ebitda_margin_y5=answers.get("ebitda_margin_y5", 0.28),
-            da_pct_revenue=answers.get("da_pct_revenue", 0.04),
-            capex_pct_revenue=answers.get("capex_pct_revenue", 0.05),
-            maintenance_capex_pct=answers.get("maintenance_capex_pct", 0.60),
-            sbc_pct_revenue=answers.get("sbc_pct_revenue", 0.08),
-
-            days_sales_outstanding=dso,
-            days_inventory_outstanding=dio,
-            days_payables_outstanding=dpo,
-            other_working_capital_pct=0.02,
-
-            tax_rate=answers.get("tax_rate", 0.24),
-            nol_balance=answers.get("nol_balance", 0),
-
-            risk_free_rate=answers.get("risk_free_rate", 0.043),
-            equity_risk_premium=answers.get("equity_risk_premium", 0.055),
-            unlevered_beta=answers.get("unlevered_beta", 1.0),
-            size_premium=answers.get("size_premium", 0.01),
-            company_specific_risk=answers.get("company_specific_risk", 0.01),
-            pre_tax_cost_of_debt=answers.get("pre_tax_cost_of_debt", 0.065),
-            target_debt_to_equity=answers.get("target_debt_to_equity", 0.25),
-
-            terminal_growth=answers.get("terminal_growth", 0.025),
-            exit_ebitda_multiple=answers.get("exit_ebitda_multiple", 12.0),
-            exit_revenue_multiple=answers.get("exit_revenue_multiple", 3.0),
-
-            total_debt=self.fin.total_debt,
-            cash=self.fin.cash,
-            minority_interest=answers.get("minority_interest", 0),
-            preferred_stock=0,
-            shares_outstanding=self.fin.shares_outstanding,
-            options_dilution=answers.get("options_dilution", 0.03),
+            company_name=fin.name,
+            ticker=fin.ticker,
+            base_revenue=fin.revenue[-1] if fin.revenue else 0,
+
+            revenue_growth_y1=m("revenue_growth_y1"),
+            revenue_growth_y2=m("revenue_growth_y2"),
+            revenue_growth_y3=m("revenue_growth_y3"),
+            revenue_growth_y4=m("revenue_growth_y4"),
+            revenue_growth_y5=m("revenue_growth_y5"),
+
+            ebitda_margin=m("ebitda_margin"),
+            ebitda_margin_y5=m("ebitda_margin_y5"),
+            da_pct_revenue=m("da_pct_revenue"),
+            capex_pct_revenue=m("capex_pct_revenue"),
+            maintenance_capex_pct=m("maintenance_capex_pct"),
+            sbc_pct_revenue=m("sbc_pct_revenue"),
+
+            days_sales_outstanding=m("days_sales_outstanding"),
+            days_inventory_outstanding=m("days_inventory_outstanding"),
+            days_payables_outstanding=m("days_payables_outstanding"),
+            other_working_capital_pct=_OTHER_WORKING_CAPITAL_PCT,
+
+            tax_rate=m("tax_rate"),
+            nol_balance=m("nol_balance"),
+
+            risk_free_rate=m("risk_free_rate"),
+            equity_risk_premium=m("equity_risk_premium"),
+            unlevered_beta=m("unlevered_beta"),
+            size_premium=m("size_premium"),
+            company_specific_risk=m("company_specific_risk"),
+            pre_tax_cost_of_debt=m("pre_tax_cost_of_debt"),
+            target_debt_to_equity=m("target_debt_to_equity"),
+
+            terminal_growth=m("terminal_growth"),
+            exit_ebitda_multiple=m("exit_ebitda_multiple"),
+            exit_revenue_multiple=m("exit_revenue_multiple"),
+
+            total_debt=fin.total_debt,
+            cash=fin.cash,
+            minority_interest=m("minority_interest"),
+            preferred_stock=_PREFERRED_STOCK,
+            shares_outstanding=fin.shares_outstanding,
+            options_dilution=m("options_dilution"),
 
             use_mid_year_convention=True,
-            projection_years=5
+            projection_years=5,
         )
 
     def get_defaults(self) -> Dict[str, Any]:
         """Get default values for all questions"""
-        questions = self.generate_questions()
-        return {q.id: q.default_value for q in questions}
+        return dict(self._iter_question_defaults())
 
 
 def generate_questions_for_company(ticker: str) -> tuple:
@@ -532,6 +384,9 @@ def generate_questions_for_company(ticker: str) -> tuple:
 
 
 if __name__ == "__main__":
+    from itertools import groupby
+    from operator import attrgetter
+
     ticker = sys.argv[1] if len(sys.argv) > 1 else "HUBS"
 
     financials, questions = generate_questions_for_company(ticker)
@@ -541,18 +396,16 @@ if __name__ == "__main__":
         print(f"DCF Assumptions for {financials.name}")
         print(f"{'='*60}")
 
-        current_category = None
-        for q in questions:
-            if q.category != current_category:
-                current_category = q.category
-                print(f"\n## {current_category}")
-                print("-" * 40)
-
-            print(f"\n{q.question}")
-            if q.value_type == "percent":
-                print(f"  Default: {q.default_value:.1%}")
-            elif q.value_type == "multiple":
-                print(f"  Default: {q.default_value:.1f}x")
-            else:
-                print(f"  Default: {q.default_value}")
-            print(f"  Hint: {q.hint}")
+        for category, group in groupby(questions, key=attrgetter("category")):
+            print(f"\n## {category}")
+            print("-" * 40)
+
+            for q in group:
+                print(f"\n{q.question}")
+                if q.value_type == "percent":
+                    print(f"  Default: {q.default_value:.1%}")
+                elif q.value_type == "multiple":
+                    print(f"  Default: {q.default_value:.1f}x")
+                else:
+                    print(f"  Default: {q.default_value}")
+                print(f"  Hint: {q.hint}")
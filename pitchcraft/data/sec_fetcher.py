@@ -4,10 +4,45 @@ Pulls company financials from public SEC filings
 """
 
 import requests
+import gzip
 import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from statistics import fmean
 from typing import Dict, Optional, List
 from dataclasses import dataclass, asdict
 
+# company_tickers.json (~1 MB) changes rarely; keep a copy for a day
+_TICKER_CACHE = Path(tempfile.gettempdir()) / "pitchcraft_tickers.json"
+_TICKER_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# companyfacts bodies (gzipped) and their ETags, revalidated with If-None-Match.
+# Pruned whenever a body is written: bodies unused for _FACTS_CACHE_MAX_AGE go,
+# then the least recently used until the rest fit in _FACTS_CACHE_MAX_BYTES
+_FACTS_CACHE_DIR = Path(tempfile.gettempdir()) / "pitchcraft_facts"
+_FACTS_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+_FACTS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_TMP_MAX_AGE = 60 * 60  # Temp files this old were left by a failed write
+
+
+def _replace_atomically(path: Path, write):
+    """Write path through write(f) on a uniquely named temp file beside it, then
+    move that into place, so concurrent readers never see a partial file and
+    concurrent writers (threads or processes) never share a temp file"""
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp",
+                                     delete=False) as f:
+        tmp = Path(f.name)
+        try:
+            write(f)
+        except BaseException:
+            f.close()
+            tmp.unlink(missing_ok=True)
+            raise
+    os.replace(tmp, path)
+
 
 @dataclass
 class CompanyFinancials:
@@ -31,6 +66,7 @@ class CompanyFinancials:
     # Derived
     ebitda_margin: float
     revenue_growth: List[float]
+    avg_revenue_growth: float  # Mean of revenue_growth, computed once at fetch
 
     # Market Data (if available)
     market_cap: Optional[float] = None
@@ -72,80 +108,171 @@ class SECFetcher:
     SHARES_TAGS = ["CommonStockSharesOutstanding", "WeightedAverageNumberOfSharesOutstandingBasic"]
     DA_TAGS = ["DepreciationDepletionAndAmortization", "DepreciationAndAmortization"]
 
+    # Annual report forms (original and amended)
+    ANNUAL_FORMS = frozenset({"10-K", "10-K/A"})
+
     def __init__(self):
+        self._local = threading.local()
         self._ticker_to_cik: Dict[str, str] = {}
         self._load_ticker_map()
 
+    @property
+    def _session(self) -> requests.Session:
+        """Pooled session, so repeat SEC calls reuse the TCP/TLS connection; one per
+        thread, as the API fetches on threadpool threads and Session isn't thread-safe"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(self.HEADERS)
+        return session
+
     def _load_ticker_map(self):
-        """Load ticker to CIK mapping from SEC"""
+        """Load ticker to CIK mapping, from the local cache if fresh, else from SEC"""
         try:
-            resp = requests.get(self.COMPANY_TICKERS_URL, headers=self.HEADERS, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-
-            for entry in data.values():
-                ticker = entry.get("ticker", "").upper()
-                cik = str(entry.get("cik_str", "")).zfill(10)
-                if ticker and cik:
-                    self._ticker_to_cik[ticker] = cik
+            data = self._read_ticker_cache()
+            if data is None:
+                resp = self._session.get(self.COMPANY_TICKERS_URL, timeout=10)
+                resp.raise_for_status()
+                data = resp.json()
+                self._write_ticker_cache(resp.content)
+
+            self._ticker_to_cik = {
+                entry["ticker"].upper(): str(entry.get("cik_str", "")).zfill(10)
+                for entry in data.values() if entry.get("ticker")
+            }
         except Exception as e:
             print(f"Warning: Could not load ticker map: {e}")
 
+    @staticmethod
+    def _read_ticker_cache() -> Optional[Dict]:
+        """Cached company_tickers.json, or None if missing, stale or unreadable"""
+        try:
+            if time.time() - _TICKER_CACHE.stat().st_mtime >= _TICKER_CACHE_TTL:
+                return None
+            return json.loads(_TICKER_CACHE.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_ticker_cache(content: bytes):
+        """Save company_tickers.json atomically, so concurrent readers never see a partial file"""
+        try:
+            _replace_atomically(_TICKER_CACHE, lambda f: f.write(content))
+        except OSError as e:
+            print(f"Warning: Could not cache ticker map: {e}")
+
     def get_cik(self, ticker: str) -> Optional[str]:
         """Get CIK for a ticker symbol"""
         return self._ticker_to_cik.get(ticker.upper())
 
     def _get_company_facts(self, cik: str) -> Optional[Dict]:
-        """Fetch all XBRL facts for a company"""
+        """Fetch all XBRL facts for a company, revalidating any cached copy by ETag"""
         url = f"{self.BASE_URL}/api/xbrl/companyfacts/CIK{cik}.json"
+        body_path = _FACTS_CACHE_DIR / f"CIK{cik}.json.gz"
+        etag_path = _FACTS_CACHE_DIR / f"CIK{cik}.etag"
         try:
-            resp = requests.get(url, headers=self.HEADERS, timeout=15)
+            etag = etag_path.read_text() if body_path.exists() else None
+        except OSError:
+            etag = None
+
+        try:
+            if etag:
+                resp = self._session.get(url, headers={"If-None-Match": etag}, timeout=15)
+                if resp.status_code == 304:  # Unchanged - skip the (often multi-MB) download
+                    try:
+                        with gzip.open(body_path, "rb") as f:
+                            facts = json.loads(f.read())
+                        os.utime(body_path)  # Mark as recently used, for pruning
+                        return facts
+                    except (OSError, ValueError):
+                        resp = self._session.get(url, timeout=15)  # Cached body unusable
+            else:
+                resp = self._session.get(url, timeout=15)
             resp.raise_for_status()
+            self._write_facts_cache(body_path, etag_path, resp.content, resp.headers.get("ETag"))
             return resp.json()
         except Exception as e:
             print(f"Error fetching company facts: {e}")
             return None
 
+    @staticmethod
+    def _write_facts_cache(body_path: Path, etag_path: Path, content: bytes, etag: Optional[str]):
+        """Save a companyfacts body and its ETag; the body goes first, so an ETag
+        on disk never vouches for an older body"""
+        if not etag:
+            return
+        try:
+            _FACTS_CACHE_DIR.mkdir(exist_ok=True)
+
+            def write_body(f):
+                with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=1) as gz:  # JSON still shrinks ~10x
+                    gz.write(content)
+
+            _replace_atomically(body_path, write_body)
+            _replace_atomically(etag_path, lambda f: f.write(etag.encode()))
+        except OSError as e:
+            print(f"Warning: Could not cache company facts: {e}")
+        SECFetcher._prune_facts_cache()
+
+    @staticmethod
+    def _prune_facts_cache():
+        """Drop companyfacts bodies (with their ETags) unused for _FACTS_CACHE_MAX_AGE,
+        then the least recently used until the rest fit in _FACTS_CACHE_MAX_BYTES,
+        and temp files left behind by failed writes"""
+        now = time.time()
+        bodies = []
+        for path in _FACTS_CACHE_DIR.iterdir() if _FACTS_CACHE_DIR.is_dir() else ():
+            try:
+                st = path.stat()
+                if path.name.endswith(".tmp"):
+                    if now - st.st_mtime > _TMP_MAX_AGE:
+                        path.unlink()
+                elif path.name.endswith(".json.gz"):
+                    bodies.append((st.st_mtime, st.st_size, path))
+            except OSError:
+                pass  # Removed by another writer meanwhile
+
+        bodies.sort(reverse=True)  # Most recently used first
+        total = 0
+        for mtime, size, path in bodies:
+            total += size
+            if now - mtime > _FACTS_CACHE_MAX_AGE or total > _FACTS_CACHE_MAX_BYTES:
+                try:
+                    # ETag first: an ETag without its body is ignored, never trusted
+                    path.with_name(path.name[:-len(".json.gz")] + ".etag").unlink(missing_ok=True)
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    pass  # Retried on the next write
+
     def _extract_values(self, facts: Dict, tags: List[str], units: str = "USD") -> List[tuple]:
         """Extract annual values for given XBRL tags"""
-        results = []
-
         us_gaap = facts.get("facts", {}).get("us-gaap", {})
+        annual_forms = self.ANNUAL_FORMS
 
+        by_year = {}
         for tag in tags:
             if tag not in us_gaap:
                 continue
 
-            tag_data = us_gaap[tag]
-            unit_data = tag_data.get("units", {}).get(units, [])
+            unit_data = us_gaap[tag].get("units", {}).get(units, [])
 
+            # Full-year (FY) 10-K values only, deduped by year in the same pass -
+            # keep the LARGEST value (consolidated total, not segments)
             for entry in unit_data:
-                # Only get 10-K (annual) filings
-                form = entry.get("form", "")
-                if form not in ["10-K", "10-K/A"]:
+                if entry.get("form") not in annual_forms or entry.get("fp") != "FY":
                     continue
-
-                # Only get full year (FY) data, not quarterly
-                fp = entry.get("fp", "")
-                if fp != "FY":
-                    continue
-
                 fy = entry.get("fy")
                 val = entry.get("val")
+                if not fy or val is None:
+                    continue
+                current = by_year.get(fy)
+                if current is None or val > current:
+                    by_year[fy] = val
 
-                if fy and val is not None:
-                    results.append((fy, val))
-
-            if results:
+            if by_year:
                 break  # Use first matching tag
 
-        # Dedupe by year - keep the LARGEST value (consolidated total, not segments)
-        by_year = {}
-        for fy, val in results:
-            if fy not in by_year or val > by_year[fy]:
-                by_year[fy] = val
-
-        return sorted(by_year.items(), key=lambda x: x[0])
+        return sorted(by_year.items())
 
     def _extract_latest(self, facts: Dict, tags: List[str], units: str = "USD") -> Optional[float]:
         """Extract most recent value for given tags"""
@@ -170,8 +297,7 @@ class SECFetcher:
             latest_year = 0
 
             for entry in unit_data:
-                form = entry.get("form", "")
-                if form not in ["10-K", "10-K/A"]:
+                if entry.get("form") not in self.ANNUAL_FORMS:
                     continue
                 fy = entry.get("fy", 0)
                 if fy > latest_year:
@@ -218,18 +344,11 @@ class SECFetcher:
 
         # Operating income as EBITDA proxy
         op_income_data = self._extract_values(facts, self.EBITDA_TAGS)
-        da_data = self._extract_values(facts, self.DA_TAGS)
-
-        ebitdas = []
-        if op_income_data:
-            for i, (year, op_inc) in enumerate(op_income_data[-5:]):
-                da = 0
-                # Find matching D&A
-                for da_year, da_val in da_data:
-                    if da_year == year:
-                        da = da_val
-                        break
-                ebitdas.append((op_inc + da) / 1_000_000)
+        da_by_year = dict(self._extract_values(facts, self.DA_TAGS))
+
+        # Add back same-year D&A (none reported counts as 0)
+        ebitdas = [(op_inc + da_by_year.get(year, 0)) / 1_000_000
+                   for year, op_inc in op_income_data[-5:]]
 
         # Balance sheet items
         total_assets = self._extract_latest(facts, self.ASSETS_TAGS)
@@ -255,13 +374,23 @@ class SECFetcher:
             cash=(cash / 1_000_000) if cash else 0,
             shares_outstanding=(shares / 1_000_000) if shares else 0,
             ebitda_margin=ebitda_margin,
-            revenue_growth=growth_rates
+            revenue_growth=growth_rates,
+            avg_revenue_growth=fmean(growth_rates) if growth_rates else 0.0
         )
 
 
+# Shared by fetch_company calls so the ticker map is loaded once per process
+_fetcher: Optional[SECFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
 def fetch_company(ticker: str) -> Optional[CompanyFinancials]:
     """Convenience function to fetch company data"""
-    fetcher = SECFetcher()
+    global _fetcher
+    with _fetcher_lock:  # Concurrent first calls share one ticker map load
+        if _fetcher is None or not _fetcher._ticker_to_cik:  # Retry a failed ticker map load
+            _fetcher = SECFetcher()
+        fetcher = _fetcher
     return fetcher.fetch(ticker)
 
 
@@ -4,13 +4,177 @@ Creates IB-quality DCF models in Excel with all the bells and whistles
 """
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, numbers
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
-from openpyxl.formatting.rule import DataBarRule
-from openpyxl.chart import BarChart, Reference
-from typing import Optional
+from openpyxl.worksheet.cell_range import CellRange
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
 from core.question_generator import DCFAssumptions
 
+# Column letters by 1-based index (_COL[2] == "B"), so builders index instead
+# of calling get_column_letter() per cell
+_COL = [None] + [get_column_letter(i) for i in range(1, 50)]
+_YEAR_COLS = _COL[2:8]  # Base..Year 5 (B-G)
+
+# Valuation formula shapes shared across tabs, filled with str.format(); every
+# argument is a cell address or sheet-qualified ref (e.g. "WACC!B15")
+FORMULA_TEMPLATES = {
+    "gordon_tv": "=Unlevered_FCF!G10*(1+{tg})/({wacc}-{tg})",
+    "exit_tv": "=EBITDA_Bridge!G6*{exit_mult}",
+    "pv_tv": "={tv}/(1+{wacc})^IF({mid_year}=1,5,5)",
+    "discount_period": "=IF({mid_year}=1,{prior}+0.5,{year})",
+    "discount_factor": "=1/(1+{wacc})^{period}",
+    "pv_fcf": "={fcf}*{factor}",
+    "enterprise_value": "={sum_pv}+{pv_tv}",
+    "less_net_debt": "=-{net_debt}",
+    "equity_value": "={ev}+{less_net_debt}",
+    "share_price": "={equity}/{shares}",
+    # Sensitivity grid cell: Years 1-5 FCF over DCF_Valuation's discount
+    # periods plus {tv} discounted 5 years, less net debt, per share
+    "sensitivity_price": (
+        "=(SUMPRODUCT(Unlevered_FCF!$C$10:$G$10/(1+{wacc})^DCF_Valuation!$C$7:$G$7)"
+        "+{tv}/(1+{wacc})^5-{net_debt})/{shares}"
+    ),
+    "sensitivity_gordon_tv": "Unlevered_FCF!$G$10*(1+{driver})/({wacc}-{driver})",
+    "sensitivity_exit_tv": "EBITDA_Bridge!$G$6*{driver}",
+}
+
+
+# Style definitions - IB standard colors
+_INPUT_FONT = Font(color="0000FF")  # Blue for inputs
+_FORMULA_FONT = Font(color="000000")  # Black for formulas
+_LINK_FONT = Font(color="008000")  # Green for cross-sheet links
+_BOLD_FONT = Font(bold=True)
+_BOLD_ITALIC_FONT = Font(bold=True, italic=True)
+_PRICE_FONT = Font(bold=True, size=12)  # Implied share price outputs
+_HEADER_FONT = Font(bold=True, size=11)
+_TITLE_FONT = Font(bold=True, size=14)
+_NOTE_FONT = Font(italic=True, color="808080")  # Gray footnotes
+_CENTER = Alignment(horizontal='center')
+_SECTION_FONT = Font(bold=True, size=11, color="FFFFFF")
+_SECTION_FILL = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
+_INPUT_FILL = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+_OUTPUT_FILL = PatternFill(start_color="D9EAD3", end_color="D9EAD3", fill_type="solid")
+_ERROR_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_BORDER_BOTTOM = Border(bottom=Side(style='thin'))
+
+
+class _SheetBuffer:
+    """Row buffer in front of a write-only worksheet.
+
+    Builders address cells by (row, column) like a normal worksheet; rows are
+    only streamed to the sheet, in order, by flush(). Plain values stay plain
+    until a builder asks for the cell (to style it).
+    """
+
+    __slots__ = ("ws", "title", "column_dimensions", "sheet_format", "_rows", "_max_row")
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.title = ws.title
+        self.column_dimensions = ws.column_dimensions
+        self.sheet_format = ws.sheet_format
+        self._rows = {}  # row -> {column: value or WriteOnlyCell}
+        self._max_row = 0  # Highest row in _rows, kept as rows are added
+
+    @property
+    def max_row(self) -> int:
+        return self._max_row
+
+    def cell(self, row: int, column: int, value=None) -> Cell:
+        if row > self._max_row:
+            self._max_row = row
+        cells = self._rows.setdefault(row, {})
+        cell = cells.get(column)
+        if isinstance(cell, Cell):
+            if value is not None:
+                cell.value = value
+            return cell
+        # Construct with the value rather than assigning it afterwards
+        cell = cells[column] = WriteOnlyCell(self.ws, cell if value is None else value)
+        return cell
+
+    def write(self, row: int, column: int, value):
+        """Store a plain value; no cell object is made unless cell() asks for one"""
+        if row > self._max_row:
+            self._max_row = row
+        self._rows.setdefault(row, {})[column] = value
+
+    def write_row(self, row: int, column: int, values):
+        """Store a run of values (or cells) starting at column in one call"""
+        if row > self._max_row:
+            self._max_row = row
+        self._rows.setdefault(row, {}).update(zip(range(column, column + len(values)), values))
+
+    def append(self, values):
+        """Write values (or cells) to the row after the last one used"""
+        self._max_row += 1
+        self._rows[self._max_row] = {col: v for col, v in enumerate(values, 1) if v is not None}
+
+    def merge_cells(self, start_row: int, start_column: int, end_row: int, end_column: int):
+        """Merge a range given by its bounds. The range goes straight into the
+        sheet's set of merged ranges: there is no range string to parse, and the
+        builders never merge overlapping ranges, so MultiCellRange.add's overlap
+        scan over every earlier merge is skipped"""
+        self.ws.merged_cells.ranges.add(CellRange(min_col=start_column, min_row=start_row,
+                                                  max_col=end_column, max_row=end_row))
+
+    def rows(self):
+        """Buffered rows in order as (row, values), values padded with None; empties the buffer"""
+        rows, self._rows = self._rows, {}
+        self._max_row = 0
+        for r in range(1, max(rows, default=0) + 1):
+            cells = rows.get(r)
+            yield r, [cells.get(c) for c in range(1, max(cells) + 1)] if cells else []
+
+    def flush(self):
+        """Stream buffered rows to the worksheet with one append() per row"""
+        append = self.ws.append
+        for _, values in self.rows():
+            append(values)
+
+
+@dataclass(slots=True)
+class _CellRefs:
+    """Addresses of named inputs/outputs, filled in as the ref-producing tabs are built"""
+    # Key_Assumptions inputs
+    base_revenue: str = ""
+    growth_y1: str = ""
+    growth_y2: str = ""
+    growth_y3: str = ""
+    growth_y4: str = ""
+    growth_y5: str = ""
+    ebitda_margin: str = ""
+    da_pct: str = ""
+    capex_pct: str = ""
+    nwc_pct: str = ""
+    tax_rate: str = ""
+    term_growth: str = ""
+    exit_mult: str = ""
+    net_debt: str = ""
+    shares: str = ""
+    mid_year: str = ""
+
+    # WACC buildup (on whichever tab wrote the block last)
+    rf_rate: str = ""
+    erp: str = ""
+    unlevered_beta: str = ""
+    beta: str = ""
+    size_prem: str = ""
+    co_risk: str = ""
+    cost_debt: str = ""
+    debt_cap: str = ""
+    cost_equity: str = ""
+    atax_cost_debt: str = ""
+    wacc: str = ""
+
 
 class ProfessionalDCFModel:
     """Generate IB-quality DCF model with professional features"""
@@ -48,122 +212,299 @@ class ProfessionalDCFModel:
         "Charts_Checks",
     ]
 
-    # Style definitions - IB standard colors
-    STYLES = {
-        'input_font': Font(color="0000FF"),  # Blue for inputs
-        'formula_font': Font(color="000000"),  # Black for formulas
-        'link_font': Font(color="008000"),  # Green for cross-sheet links
-        'header_font': Font(bold=True, size=11),
-        'title_font': Font(bold=True, size=14),
-        'section_font': Font(bold=True, size=11, color="FFFFFF"),
-        'section_fill': PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid"),
-        'input_fill': PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid"),
-        'output_fill': PatternFill(start_color="D9EAD3", end_color="D9EAD3", fill_type="solid"),
-        'error_fill': PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
-        'border': Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        ),
-        'border_bottom': Border(bottom=Side(style='thin')),
+    # Tabs whose builders read assumption values (self.a). Every other tab is
+    # fixed by which tabs are enabled: its formulas reach the assumptions only
+    # through Key_Assumptions / WACC cell refs, which sit at fixed addresses
+    ASSUMPTION_TABS = frozenset({"Cover", "Key_Assumptions", "WACC"})
+
+    # Tabs that register the cell refs (_refs) other tabs' formulas link to;
+    # always built, whatever enabled_sheets asks for
+    REF_TABS = frozenset({"Key_Assumptions", "WACC"})
+
+    # Column headers for every time-series sheet (columns B-G)
+    YEAR_HEADERS = ("Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5")
+
+    # Year-series tabs that apply a Key_Assumptions % of revenue to revenue:
+    # sheet -> (title, % row label, assumption ref, output row label)
+    PCT_OF_REVENUE_SHEETS = {
+        "D&A": ("Depreciation & Amortization", "D&A (% Rev)", "da_pct", "D&A"),
+        "Capex": ("Capital Expenditures", "Capex (% Rev)", "capex_pct", "Capex"),
+    }
+
+    # Tabs that are still just a title and a note: sheet -> (title, note)
+    PLACEHOLDER_SHEETS = {
+        "Historical_IS": ("Historical IS", "(Populate with historical financials)"),
+        "Historical_BS": ("Historical BS", "(Populate with historical financials)"),
+        "Historical_CF": ("Historical CF", "(Populate with historical financials)"),
+        "COGS_Gross_Margin": ("COGS & Gross Margin", "(Placeholder for COGS and gross margin build)"),
+        "Opex": ("Operating Expenses", "(Placeholder for opex build)"),
+        "Other_Operating": ("Other Operating Items", "(Placeholder for other operating items)"),
+        "Debt_Schedule": ("Debt Schedule", "(Placeholder for debt schedule)"),
+        "Interest_Expense": ("Interest Expense", "(Placeholder for interest schedule)"),
+        "Share_Count": ("Share Count", "(Placeholder for share count schedule)"),
+        "Trading_Comps": ("Trading Comps", "(Placeholder for trading comps)"),
+        "Transactions_Comps": ("Transactions Comps", "(Placeholder for transactions comps)"),
     }
 
-    def __init__(self, assumptions: DCFAssumptions):
+    # Scenario_Manager deal case: (label, value, input number format or None for plain text)
+    SCENARIO_ROWS = (
+        ("Buyer", "Comcast (CMCSA)", None),
+        ("Target", "Altice USA (ATUS)", None),
+        ("Deal Type", "Strategic Acquisition", None),
+        ("Purchase Premium", 0.30, '0.0%'),
+        ("LTM EV/EBITDA Multiple", 7.5, '0.0x'),
+        ("Synergies (Run-Rate, $M)", 300, '#,##0'),
+        ("Funding Mix (Debt / Equity)", "60% / 40%", None),
+    )
+
+    # Charts_Checks validation checks: (check, formula template, description);
+    # templates are filled with the {wacc}, {tg}, {base_revenue} and {shares} links
+    CHECK_ROWS = (
+        ("WACC > Terminal Growth", '=IF({wacc}>{tg},"PASS","FAIL")', "Terminal growth must be less than WACC"),
+        ("WACC is Reasonable (5-15%)", '=IF(AND({wacc}>=0.05,{wacc}<=0.15),"PASS","WARNING")', "WACC typically ranges 5-15%"),
+        ("Terminal Growth ≤ 4%", '=IF({tg}<=0.04,"PASS","WARNING")', "Should not exceed long-term GDP growth"),
+        ("Positive Base Revenue", '=IF({base_revenue}>0,"PASS","FAIL")', "Revenue must be positive"),
+        ("Shares Outstanding > 0", '=IF({shares}>0,"PASS","FAIL")', "Shares must be positive"),
+    )
+
+    def __init__(self, assumptions: DCFAssumptions, enabled_sheets: Optional[Iterable[str]] = None):
+        """enabled_sheets limits the workbook to those tabs plus REF_TABS (default:
+        all of TAB_ORDER). Links into other skipped tabs are left dangling.
+        Raises ValueError on a name that is not in TAB_ORDER."""
         self.a = assumptions
-        self.wb = Workbook()
-        self._cell_refs = {}  # Store cell references for formulas
+        self.wb = Workbook(write_only=True)
+        self._refs = _CellRefs()  # Store cell references for formulas
+        self._named_styles = set()  # Names registered with the workbook
+
+        # Write-only sheets can't be reordered, so create every tab up front in
+        # TAB_ORDER; builders fill the buffers in dependency order
+        if enabled_sheets is None:
+            self._enabled_sheets = set(self.TAB_ORDER)
+        else:
+            self._enabled_sheets = set(enabled_sheets)
+            unknown = self._enabled_sheets.difference(self.TAB_ORDER)
+            if unknown:
+                raise ValueError(f"Unknown tabs {sorted(unknown)}; expected names from TAB_ORDER")
+            self._enabled_sheets |= self.REF_TABS
+        self._sheets = {name: _SheetBuffer(self.wb.create_sheet(name))
+                        for name in self.TAB_ORDER if name in self._enabled_sheets}
+        self.sheetnames = list(self._sheets)  # Tabs the workbook will contain, in order
+
+        # Computed values for compatibility with model. Every DCFAssumptions
+        # field is required, so read them directly (no getattr fallbacks)
+        a = assumptions
 
-        # Computed values for compatibility with model
         # NWC from cash conversion cycle (DSO + DIO - DPO)
-        ccc = (getattr(assumptions, 'days_sales_outstanding', 45) +
-               getattr(assumptions, 'days_inventory_outstanding', 15) -
-               getattr(assumptions, 'days_payables_outstanding', 35))
+        ccc = a.days_sales_outstanding + a.days_inventory_outstanding - a.days_payables_outstanding
         self._nwc_pct_revenue = ccc / 365
 
         # WACC buildup values
-        self._unlevered_beta = getattr(assumptions, 'unlevered_beta', 1.0)
-        tax_rate = assumptions.tax_rate
-        target_de = getattr(assumptions, 'target_debt_to_equity', 0.25)
-        self._levered_beta = self._unlevered_beta * (1 + (1 - tax_rate) * target_de)
-        self._cost_of_debt = getattr(assumptions, 'pre_tax_cost_of_debt', 0.06)
-        self._debt_to_capital = target_de / (1 + target_de)
+        self._unlevered_beta = a.unlevered_beta
+        self._levered_beta = a.levered_beta
+        self._cost_of_debt = a.pre_tax_cost_of_debt
+        self._debt_to_capital = a.debt_weight
 
         # Size and company-specific premiums
-        self._size_premium = getattr(assumptions, 'size_premium', 0)
-        self._company_specific_risk = getattr(assumptions, 'company_specific_risk', 0)
+        self._size_premium = a.size_premium
+        self._company_specific_risk = a.company_specific_risk
 
         # Net debt computed from total_debt and cash
-        self._net_debt = getattr(assumptions, 'total_debt', 0) - getattr(assumptions, 'cash', 0)
+        self._net_debt = a.total_debt - a.cash
 
-    def _setup_sheet(self, ws, title: str):
+    def _setup_sheet(self, ws):
         """Apply standard formatting to a worksheet"""
-        ws.title = title
+        ws.sheet_format.defaultColWidth = 14  # Every column but the label column
         ws.column_dimensions['A'].width = 35
-        for i in range(2, 15):
-            ws.column_dimensions[get_column_letter(i)].width = 14
 
     def _add_title(self, ws, row: int, text: str) -> int:
         cell = ws.cell(row=row, column=1, value=text)
-        cell.font = self.STYLES['title_font']
+        cell.font = _TITLE_FONT
         return row + 2
 
     def _add_section_header(self, ws, row: int, text: str, span: int = 8) -> int:
         """Add a section header row"""
         cell = ws.cell(row=row, column=1, value=text)
-        cell.font = self.STYLES['section_font']
-        cell.fill = self.STYLES['section_fill']
+        cell.font = _SECTION_FONT
+        cell.fill = _SECTION_FILL
         ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=span)
         return row + 1
 
+    def _write_cells(self, ws, cells):
+        """Write (row, col, value, font, number format) specs in one pass"""
+        write, put = ws.write, ws.cell
+        for row, col, value, font, fmt in cells:
+            if font is None and fmt is None:
+                write(row, col, value)
+                continue
+            cell = put(row=row, column=col, value=value)
+            if font:
+                cell.font = font
+            if fmt:
+                cell.number_format = fmt
+
+    def _write_year_headers(self, ws, row: int) -> int:
+        """Write the Base..Year 5 header row starting in column B"""
+        put, font, center = ws.cell, _HEADER_FONT, _CENTER
+        for col, year in enumerate(self.YEAR_HEADERS, 2):
+            cell = put(row=row, column=col, value=year)
+            cell.font = font
+            cell.alignment = center
+        return row + 1
+
+    def _write_label_rows(self, ws, row: int, rows) -> int:
+        """Write (label, value, input format) rows; a format marks the value as an input cell"""
+        write, add_input = ws.write, self._add_input_cell
+        for label, value, fmt in rows:
+            write(row, 1, label)
+            if fmt is None:
+                write(row, 2, value)
+            else:
+                add_input(ws, row, 2, value, fmt)
+            row += 1
+        return row
+
+    def _write_assumption_row(self, ws, row: int, label: str, ref: str) -> int:
+        """Write a row linking every year column to one Key_Assumptions percentage"""
+        ws.write(row, 1, label)
+        link = f"=Key_Assumptions!{self._ref(ref)}"
+        put = ws.cell
+        for col in range(2, 8):
+            put(row=row, column=col, value=link).number_format = '0.0%'
+        return row + 1
+
+    def _named_style(self, kind: str, fmt: Optional[str], font: Font, fill: PatternFill) -> str:
+        """Name of the bordered `kind` NamedStyle for a number format, registered on first use"""
+        name = f"{kind} {fmt}" if fmt else kind
+        if name not in self._named_styles:
+            self.wb.add_named_style(NamedStyle(
+                name=name,
+                font=font,
+                fill=fill,
+                border=_BORDER,
+                number_format=fmt or 'General',
+            ))
+            self._named_styles.add(name)
+        return name
+
+    def _input_style(self, fmt: Optional[str]) -> str:
+        """Name of the input NamedStyle for a number format, registered on first use"""
+        return self._named_style("Input", fmt, _INPUT_FONT, _INPUT_FILL)
+
     def _add_input_cell(self, ws, row: int, col: int, value, fmt: str = None, name: str = None):
         """Add an input cell with blue font and yellow background"""
         cell = ws.cell(row=row, column=col, value=value)
-        cell.font = self.STYLES['input_font']
-        cell.fill = self.STYLES['input_fill']
-        cell.border = self.STYLES['border']
-        if fmt:
-            cell.number_format = fmt
+        cell.style = self._input_style(fmt)  # Font, fill, border and format in one assignment
         if name:
-            self._cell_refs[name] = f"{get_column_letter(col)}{row}"
+            setattr(self._refs, name, f"{_COL[col]}{row}")
+        return cell
+
+    def _add_output_cell(self, ws, row: int, col: int, formula: str, fmt: str, price: bool = False):
+        """Add a bold, green, bordered output formula cell (larger font for share prices)"""
+        kind, font = ("Price", _PRICE_FONT) if price else ("Output", _BOLD_FONT)
+        cell = ws.cell(row=row, column=col, value=formula)
+        cell.style = self._named_style(kind, fmt, font, _OUTPUT_FILL)
         return cell
 
     def _add_formula_cell(self, ws, row: int, col: int, formula: str, fmt: str = None, bold: bool = False):
         """Add a formula cell"""
         cell = ws.cell(row=row, column=col, value=formula)
-        cell.font = Font(bold=bold) if bold else self.STYLES['formula_font']
+        cell.font = _BOLD_FONT if bold else _FORMULA_FONT
         if fmt:
             cell.number_format = fmt
         return cell
 
+    def _write_formula_row(self, ws, row: int, label: str, formulas, fmt: str = '#,##0',
+                           bold: bool = False, column: int = 2) -> int:
+        """Write a label and a run of formula cells (Base..Year 5 by default) as one row"""
+        font = _BOLD_FONT if bold else _FORMULA_FONT
+        cells = []
+        for formula in formulas:
+            cell = WriteOnlyCell(ws.ws, formula)
+            cell.font = font
+            cell.number_format = fmt
+            cells.append(cell)
+        if label is not None:
+            ws.write(row, 1, label)
+        ws.write_row(row, column, cells)
+        return row + 1
+
     def _ref(self, name: str) -> str:
-        """Get cell reference by name"""
-        return self._cell_refs.get(name, "")
+        """Get cell reference by name (for names only known at runtime)"""
+        return getattr(self._refs, name)
+
+    def _write_wacc_block(self, ws, row: int, tax_rate_sheet: Optional[str] = None) -> int:
+        """WACC buildup inputs plus cost of equity / debt and WACC formulas.
+
+        Registers the input refs plus cost_equity, atax_cost_debt and wacc;
+        tax_rate_sheet qualifies the tax rate ref when the block is not on
+        Key_Assumptions. Returns the row after WACC.
+        """
+        row = self._add_section_header(ws, row, "WACC BUILDUP", 4)
+        wacc_inputs = [
+            ("Risk-Free Rate", self.a.risk_free_rate, '0.00%', 'rf_rate'),
+            ("Equity Risk Premium", self.a.equity_risk_premium, '0.00%', 'erp'),
+            ("Unlevered Beta", self._unlevered_beta, '0.00', 'unlevered_beta'),
+            ("Levered Beta", self._levered_beta, '0.00', 'beta'),
+            ("Size Premium", self._size_premium, '0.00%', 'size_prem'),
+            ("Company Risk Premium", self._company_specific_risk, '0.00%', 'co_risk'),
+            ("Pre-Tax Cost of Debt", self._cost_of_debt, '0.00%', 'cost_debt'),
+            ("Debt / Total Capital", self._debt_to_capital, '0.0%', 'debt_cap'),
+        ]
+        for label, value, fmt, name in wacc_inputs:
+            ws.write(row, 1, label)
+            self._add_input_cell(ws, row, 2, value, fmt, name)
+            row += 1
+
+        refs = self._refs
+        rf, beta, erp, sp, cr = refs.rf_rate, refs.beta, refs.erp, refs.size_prem, refs.co_risk
+        cd, dc = refs.cost_debt, refs.debt_cap
+        tr = f"{tax_rate_sheet}!{refs.tax_rate}" if tax_rate_sheet else refs.tax_rate
 
-    def build_cover_sheet(self):
-        """Build the Cover tab"""
-        ws = self.wb.active
-        self._setup_sheet(ws, "Cover")
-        row = 1
-        row = self._add_title(ws, row, f"DCF Valuation Model - {self.a.company_name} ({self.a.ticker})")
-        ws.cell(row=row, column=1, value="Prepared For: Investment Banking Associates")
         row += 1
-        ws.cell(row=row, column=1, value="Prepared By: PitchCraftAI")
+        ws.write(row, 1, "Cost of Equity (CAPM + Adj)")
+        self._add_formula_cell(ws, row, 2, f"={rf}+{beta}*{erp}+{sp}+{cr}", '0.00%')
+        cost_equity = refs.cost_equity = f"B{row}"
         row += 1
-        ws.cell(row=row, column=1, value="As of: February 3, 2026")
+
+        ws.write(row, 1, "After-Tax Cost of Debt")
+        self._add_formula_cell(ws, row, 2, f"={cd}*(1-{tr})", '0.00%')
+        atax_cost_debt = refs.atax_cost_debt = f"B{row}"
+        row += 1
+
+        ws.write(row, 1, "WACC")
+        ws.cell(row=row, column=1).font = _BOLD_FONT
+        wacc_formula = f"={cost_equity}*(1-{dc})+{atax_cost_debt}*{dc}"
+        self._add_output_cell(ws, row, 2, wacc_formula, '0.00%')
+        refs.wacc = f"B{row}"
+        return row + 1
+
+    def build_cover_sheet(self):
+        """Build the Cover tab"""
+        ws = self._sheets.get("Cover")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
+        self._write_cells(ws, [
+            (1, 1, f"DCF Valuation Model - {self.a.company_name} ({self.a.ticker})", _TITLE_FONT, None),
+            (3, 1, "Prepared For: Investment Banking Associates", None, None),
+            (4, 1, "Prepared By: PitchCraftAI", None, None),
+            (5, 1, "As of: February 3, 2026", None, None),
+        ])
         return ws
 
     def build_contents_sheet(self):
         """Build the Contents tab with a table of contents"""
-        ws = self.wb.create_sheet("Contents")
-        self._setup_sheet(ws, "Contents")
+        ws = self._sheets.get("Contents")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "Model Contents")
 
-        ws.cell(row=row, column=1, value="Tab")
-        ws.cell(row=row, column=2, value="Purpose")
-        ws.cell(row=row, column=1).font = self.STYLES['header_font']
-        ws.cell(row=row, column=2).font = self.STYLES['header_font']
+        ws.write(row, 1, "Tab")
+        ws.write(row, 2, "Purpose")
+        ws.cell(row=row, column=1).font = _HEADER_FONT
+        ws.cell(row=row, column=2).font = _HEADER_FONT
         row += 1
 
         tabs = [
@@ -198,25 +539,26 @@ class ProfessionalDCFModel:
             ("Transactions_Comps", "Transactions comps"),
             ("Charts_Checks", "Charts and error checks"),
         ]
+        tabs = [tab_row for tab_row in tabs if tab_row[0] in self._sheets]
 
-        for tab, purpose in tabs:
-            ws.cell(row=row, column=1, value=tab)
-            ws.cell(row=row, column=2, value=purpose)
-            row += 1
+        for tab_row in tabs:
+            ws.append(tab_row)
 
         return ws
 
     def build_inputs_index_sheet(self):
         """Build an index of key inputs"""
-        ws = self.wb.create_sheet("Inputs_Index")
-        self._setup_sheet(ws, "Inputs_Index")
+        ws = self._sheets.get("Inputs_Index")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "Inputs Index")
 
-        ws.cell(row=row, column=1, value="Input")
-        ws.cell(row=row, column=2, value="Value")
-        ws.cell(row=row, column=1).font = self.STYLES['header_font']
-        ws.cell(row=row, column=2).font = self.STYLES['header_font']
+        ws.write(row, 1, "Input")
+        ws.write(row, 2, "Value")
+        ws.cell(row=row, column=1).font = _HEADER_FONT
+        ws.cell(row=row, column=2).font = _HEADER_FONT
         row += 1
 
         inputs = [
@@ -233,33 +575,34 @@ class ProfessionalDCFModel:
             ("Shares (M)", "Key_Assumptions", "shares"),
         ]
 
-        for label, sheet, ref in inputs:
-            ws.cell(row=row, column=1, value=label)
-            ws.cell(row=row, column=2, value=f"={sheet}!{self._ref(ref)}" if self._ref(ref) else "—")
-            row += 1
+        for label, sheet, name in inputs:
+            ref = self._ref(name)
+            ws.append([label, f"={sheet}!{ref}" if ref else "—"])
 
         return ws
 
     def build_key_assumptions_sheet(self):
         """Build the Key Assumptions tab"""
-        ws = self.wb.create_sheet("Key_Assumptions")
-        self._setup_sheet(ws, "Key_Assumptions")
+        ws = self._sheets.get("Key_Assumptions")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
 
         row = 1
         row = self._add_title(ws, row, f"Key Assumptions - {self.a.company_name} ({self.a.ticker})")
 
         # Company Info
         row = self._add_section_header(ws, row, "COMPANY INFORMATION", 4)
-        ws.cell(row=row, column=1, value="Company Name")
-        ws.cell(row=row, column=2, value=self.a.company_name)
+        ws.write(row, 1, "Company Name")
+        ws.write(row, 2, self.a.company_name)
         row += 1
-        ws.cell(row=row, column=1, value="Ticker")
-        ws.cell(row=row, column=2, value=self.a.ticker)
+        ws.write(row, 1, "Ticker")
+        ws.write(row, 2, self.a.ticker)
         row += 2
 
         # Revenue Assumptions
         row = self._add_section_header(ws, row, "REVENUE ASSUMPTIONS", 4)
-        ws.cell(row=row, column=1, value="Base Year Revenue ($M)")
+        ws.write(row, 1, "Base Year Revenue ($M)")
         self._add_input_cell(ws, row, 2, self.a.base_revenue, '#,##0', 'base_revenue')
         row += 1
 
@@ -271,7 +614,7 @@ class ProfessionalDCFModel:
             ("Year 5 Growth", self.a.revenue_growth_y5, 'growth_y5'),
         ]
         for label, value, name in growth_rates:
-            ws.cell(row=row, column=1, value=label)
+            ws.write(row, 1, label)
             self._add_input_cell(ws, row, 2, value, '0.0%', name)
             row += 1
         row += 1
@@ -286,786 +629,571 @@ class ProfessionalDCFModel:
             ("Tax Rate", self.a.tax_rate, '0.0%', 'tax_rate'),
         ]
         for label, value, fmt, name in op_assumptions:
-            ws.cell(row=row, column=1, value=label)
+            ws.write(row, 1, label)
             self._add_input_cell(ws, row, 2, value, fmt, name)
             row += 1
         row += 1
 
         # WACC Buildup
-        row = self._add_section_header(ws, row, "WACC BUILDUP", 4)
-        wacc_inputs = [
-            ("Risk-Free Rate", self.a.risk_free_rate, '0.00%', 'rf_rate'),
-            ("Equity Risk Premium", self.a.equity_risk_premium, '0.00%', 'erp'),
-            ("Unlevered Beta", self._unlevered_beta, '0.00', 'unlevered_beta'),
-            ("Levered Beta", self._levered_beta, '0.00', 'beta'),
-            ("Size Premium", self._size_premium, '0.00%', 'size_prem'),
-            ("Company Risk Premium", self._company_specific_risk, '0.00%', 'co_risk'),
-            ("Pre-Tax Cost of Debt", self._cost_of_debt, '0.00%', 'cost_debt'),
-            ("Debt / Total Capital", self._debt_to_capital, '0.0%', 'debt_cap'),
-        ]
-        for label, value, fmt, name in wacc_inputs:
-            ws.cell(row=row, column=1, value=label)
-            self._add_input_cell(ws, row, 2, value, fmt, name)
-            row += 1
-
-        # Calculated WACC
-        row += 1
-        ws.cell(row=row, column=1, value="Cost of Equity (CAPM + Adj)")
-        cost_equity_formula = f"={self._ref('rf_rate')}+{self._ref('beta')}*{self._ref('erp')}+{self._ref('size_prem')}+{self._ref('co_risk')}"
-        self._add_formula_cell(ws, row, 2, cost_equity_formula, '0.00%')
-        self._cell_refs['cost_equity'] = f"B{row}"
-        row += 1
-
-        ws.cell(row=row, column=1, value="After-Tax Cost of Debt")
-        atax_debt_formula = f"={self._ref('cost_debt')}*(1-{self._ref('tax_rate')})"
-        self._add_formula_cell(ws, row, 2, atax_debt_formula, '0.00%')
-        self._cell_refs['atax_cost_debt'] = f"B{row}"
-        row += 1
-
-        ws.cell(row=row, column=1, value="WACC")
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        wacc_formula = f"={self._ref('cost_equity')}*(1-{self._ref('debt_cap')})+{self._ref('atax_cost_debt')}*{self._ref('debt_cap')}"
-        cell = self._add_formula_cell(ws, row, 2, wacc_formula, '0.00%', bold=True)
-        cell.fill = self.STYLES['output_fill']
-        cell.border = self.STYLES['border']
-        self._cell_refs['wacc'] = f"B{row}"
-        row += 2
+        row = self._write_wacc_block(ws, row) + 1
 
         # Terminal Value Assumptions
         row = self._add_section_header(ws, row, "TERMINAL VALUE ASSUMPTIONS", 4)
-        ws.cell(row=row, column=1, value="Perpetuity Growth Rate")
+        ws.write(row, 1, "Perpetuity Growth Rate")
         self._add_input_cell(ws, row, 2, self.a.terminal_growth, '0.00%', 'term_growth')
         row += 1
-        ws.cell(row=row, column=1, value="Exit EV/EBITDA Multiple")
+        ws.write(row, 1, "Exit EV/EBITDA Multiple")
         self._add_input_cell(ws, row, 2, self.a.exit_ebitda_multiple, '0.0x', 'exit_mult')
         row += 2
 
         # Capital Structure
         row = self._add_section_header(ws, row, "CAPITAL STRUCTURE", 4)
-        ws.cell(row=row, column=1, value="Net Debt ($M)")
+        ws.write(row, 1, "Net Debt ($M)")
         self._add_input_cell(ws, row, 2, self._net_debt, '#,##0', 'net_debt')
         row += 1
-        ws.cell(row=row, column=1, value="Shares Outstanding (M)")
+        ws.write(row, 1, "Shares Outstanding (M)")
         self._add_input_cell(ws, row, 2, self.a.shares_outstanding, '#,##0.0', 'shares')
         row += 2
 
         # Model Settings
         row = self._add_section_header(ws, row, "MODEL SETTINGS", 4)
-        ws.cell(row=row, column=1, value="Use Mid-Year Convention")
+        ws.write(row, 1, "Use Mid-Year Convention")
         self._add_input_cell(ws, row, 2, 1 if self.a.use_mid_year_convention else 0, '0', 'mid_year')
-        ws.cell(row=row, column=3, value="(1=Yes, 0=No)")
+        ws.write(row, 3, "(1=Yes, 0=No)")
 
         return ws
 
     def build_historical_sheets(self):
         """Build placeholder historical financials tabs"""
         for name in ["Historical_IS", "Historical_BS", "Historical_CF"]:
-            ws = self.wb.create_sheet(name)
-            self._setup_sheet(ws, name)
-            row = 1
-            row = self._add_title(ws, row, f"{name.replace('_', ' ')}")
-            ws.cell(row=row, column=1, value="(Populate with historical financials)")
+            self._build_placeholder_sheet(name)
         return True
 
     def build_revenue_build_sheet(self):
-        ws = self.wb.create_sheet("Revenue_Build")
-        self._setup_sheet(ws, "Revenue_Build")
+        ws = self._sheets.get("Revenue_Build")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "Revenue Build")
 
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
+        row = self._write_year_headers(ws, row)
 
-        ws.cell(row=row, column=1, value="Revenue Growth")
-        ws.cell(row=row, column=2, value="—")
-        growth_refs = ['growth_y1', 'growth_y2', 'growth_y3', 'growth_y4', 'growth_y5']
-        for i, ref in enumerate(growth_refs):
-            cell = ws.cell(row=row, column=i+3, value=f"=Key_Assumptions!{self._ref(ref)}")
-            cell.font = self.STYLES['link_font']
+        ws.write(row, 1, "Revenue Growth")
+        ws.write(row, 2, "—")
+        refs = self._refs
+        growth_refs = [refs.growth_y1, refs.growth_y2, refs.growth_y3, refs.growth_y4, refs.growth_y5]
+        for col, growth_ref in enumerate(growth_refs, 3):
+            cell = ws.cell(row=row, column=col, value=f"=Key_Assumptions!{growth_ref}")
+            cell.font = _LINK_FONT
             cell.number_format = '0.0%'
         row += 1
 
-        ws.cell(row=row, column=1, value="Revenue")
-        ws.cell(row=row, column=2, value=f"=Key_Assumptions!{self._ref('base_revenue')}")
-        ws.cell(row=row, column=2).number_format = '#,##0'
-        for i in range(5):
-            col = i + 3
-            prev_col = get_column_letter(col - 1)
-            curr_col = get_column_letter(col)
-            formula = f"={prev_col}{row}*(1+{curr_col}{row-1})"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
+        ws.cell(row=row, column=2, value=f"=Key_Assumptions!{refs.base_revenue}").number_format = '#,##0'
+        self._write_formula_row(ws, row, "Revenue", [f"={prev}{row}*(1+{c}{row-1})"
+                                                     for prev, c in zip(_COL[2:7], _COL[3:8])], column=3)
         return ws
 
     def build_cogs_gross_margin_sheet(self):
-        ws = self.wb.create_sheet("COGS_Gross_Margin")
-        self._setup_sheet(ws, "COGS_Gross_Margin")
-        row = 1
-        row = self._add_title(ws, row, "COGS & Gross Margin")
-        ws.cell(row=row, column=1, value="(Placeholder for COGS and gross margin build)")
-        return ws
+        return self._build_placeholder_sheet("COGS_Gross_Margin")
 
     def build_opex_sheet(self):
-        ws = self.wb.create_sheet("Opex")
-        self._setup_sheet(ws, "Opex")
-        row = 1
-        row = self._add_title(ws, row, "Operating Expenses")
-        ws.cell(row=row, column=1, value="(Placeholder for opex build)")
-        return ws
+        return self._build_placeholder_sheet("Opex")
 
     def build_ebitda_bridge_sheet(self):
-        ws = self.wb.create_sheet("EBITDA_Bridge")
-        self._setup_sheet(ws, "EBITDA_Bridge")
+        ws = self._sheets.get("EBITDA_Bridge")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "EBITDA Bridge")
 
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
+        row = self._write_year_headers(ws, row)
 
-        ws.cell(row=row, column=1, value="Revenue")
-        for i in range(6):
-            col = i + 2
-            ws.cell(row=row, column=col, value=f"=Revenue_Build!{get_column_letter(col)}5").number_format = '#,##0'
+        ws.write(row, 1, "Revenue")
+        for col in range(2, 8):
+            ws.cell(row=row, column=col, value=f"=Revenue_Build!{_COL[col]}5").number_format = '#,##0'
         row += 1
 
-        ws.cell(row=row, column=1, value="EBITDA Margin")
-        for i in range(6):
-            col = i + 2
-            cell = ws.cell(row=row, column=col, value=f"=Key_Assumptions!{self._ref('ebitda_margin')}")
-            cell.number_format = '0.0%'
-        row += 1
+        row = self._write_assumption_row(ws, row, "EBITDA Margin", 'ebitda_margin')
 
-        ws.cell(row=row, column=1, value="EBITDA")
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        for i in range(6):
-            col = i + 2
-            formula = f"={get_column_letter(col)}{row-2}*{get_column_letter(col)}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '#,##0', bold=True)
+        self._write_formula_row(ws, row, "EBITDA", [f"={c}{row-2}*{c}{row-1}" for c in _YEAR_COLS], bold=True)
+        ws.cell(row=row, column=1).font = _BOLD_FONT
         return ws
 
-    def build_da_sheet(self):
-        ws = self.wb.create_sheet("D&A")
-        self._setup_sheet(ws, "D&A")
-        row = 1
-        row = self._add_title(ws, row, "Depreciation & Amortization")
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
-        ws.cell(row=row, column=1, value="D&A (% Rev)")
-        for i in range(6):
-            col = i + 2
-            cell = ws.cell(row=row, column=col, value=f"=Key_Assumptions!{self._ref('da_pct')}")
-            cell.number_format = '0.0%'
-        row += 1
-        ws.cell(row=row, column=1, value="D&A")
-        for i in range(6):
-            col = i + 2
-            formula = f"=-Revenue_Build!{get_column_letter(col)}5*{get_column_letter(col)}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
+    def _build_placeholder_sheet(self, name: str):
+        """Build a PLACEHOLDER_SHEETS tab: title, then the note two rows down"""
+        title, note = self.PLACEHOLDER_SHEETS[name]
+        ws = self._sheets.get(name)
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
+        self._write_cells(ws, [
+            (1, 1, title, _TITLE_FONT, None),
+            (3, 1, note, None, None),
+        ])
         return ws
 
-    def build_capex_sheet(self):
-        ws = self.wb.create_sheet("Capex")
-        self._setup_sheet(ws, "Capex")
+    def _build_percent_of_revenue_sheet(self, name: str):
+        """Build a PCT_OF_REVENUE_SHEETS tab: % Rev link row, then -(revenue x %)"""
+        title, pct_label, pct_ref, output_label = self.PCT_OF_REVENUE_SHEETS[name]
+        ws = self._sheets.get(name)
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
-        row = self._add_title(ws, row, "Capital Expenditures")
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
-        ws.cell(row=row, column=1, value="Capex (% Rev)")
-        for i in range(6):
-            col = i + 2
-            cell = ws.cell(row=row, column=col, value=f"=Key_Assumptions!{self._ref('capex_pct')}")
-            cell.number_format = '0.0%'
-        row += 1
-        ws.cell(row=row, column=1, value="Capex")
-        for i in range(6):
-            col = i + 2
-            formula = f"=-Revenue_Build!{get_column_letter(col)}5*{get_column_letter(col)}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
+        row = self._add_title(ws, row, title)
+        row = self._write_year_headers(ws, row)
+        row = self._write_assumption_row(ws, row, pct_label, pct_ref)
+        self._write_formula_row(ws, row, output_label, [f"=-Revenue_Build!{c}5*{c}{row-1}" for c in _YEAR_COLS])
         return ws
 
+    def build_da_sheet(self):
+        return self._build_percent_of_revenue_sheet("D&A")
+
+    def build_capex_sheet(self):
+        return self._build_percent_of_revenue_sheet("Capex")
+
     def build_working_capital_sheet(self):
-        ws = self.wb.create_sheet("Working_Capital")
-        self._setup_sheet(ws, "Working_Capital")
+        ws = self._sheets.get("Working_Capital")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "Working Capital")
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
-        ws.cell(row=row, column=1, value="NWC (% Rev)")
-        for i in range(6):
-            col = i + 2
-            cell = ws.cell(row=row, column=col, value=f"=Key_Assumptions!{self._ref('nwc_pct')}")
-            cell.number_format = '0.0%'
-        row += 1
-        ws.cell(row=row, column=1, value="Change in NWC")
+        row = self._write_year_headers(ws, row)
+        row = self._write_assumption_row(ws, row, "NWC (% Rev)", 'nwc_pct')
         ws.cell(row=row, column=2, value=0).number_format = '#,##0'
-        for i in range(5):
-            col = i + 3
-            prev_col = get_column_letter(col - 1)
-            curr_col = get_column_letter(col)
-            formula = f"=-({curr_col}5-{prev_col}5)*{curr_col}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
+        self._write_formula_row(ws, row, "Change in NWC", [f"=-(Revenue_Build!{c}5-Revenue_Build!{prev}5)*{c}{row-1}"
+                                                           for prev, c in zip(_COL[2:7], _COL[3:8])], column=3)
         return ws
 
     def build_other_operating_sheet(self):
-        ws = self.wb.create_sheet("Other_Operating")
-        self._setup_sheet(ws, "Other_Operating")
-        row = 1
-        row = self._add_title(ws, row, "Other Operating Items")
-        ws.cell(row=row, column=1, value="(Placeholder for other operating items)")
-        return ws
+        return self._build_placeholder_sheet("Other_Operating")
 
     def build_taxes_sheet(self):
-        ws = self.wb.create_sheet("Taxes")
-        self._setup_sheet(ws, "Taxes")
+        ws = self._sheets.get("Taxes")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "Taxes")
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
-        ws.cell(row=row, column=1, value="EBIT")
-        for i in range(6):
-            col = i + 2
-            formula = f"=EBITDA_Bridge!{get_column_letter(col)}6+D&A!{get_column_letter(col)}5"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 1
-        ws.cell(row=row, column=1, value="Tax Rate")
-        for i in range(6):
-            col = i + 2
-            cell = ws.cell(row=row, column=col, value=f"=Key_Assumptions!{self._ref('tax_rate')}")
-            cell.number_format = '0.0%'
-        row += 1
-        ws.cell(row=row, column=1, value="Taxes")
-        for i in range(6):
-            col = i + 2
-            formula = f"=-MAX(0,{get_column_letter(col)}{row-2})*{get_column_letter(col)}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
+        row = self._write_year_headers(ws, row)
+        row = self._write_formula_row(ws, row, "EBIT", [f"=EBITDA_Bridge!{c}6+D&A!{c}5" for c in _YEAR_COLS])
+        row = self._write_assumption_row(ws, row, "Tax Rate", 'tax_rate')
+        self._write_formula_row(ws, row, "Taxes", [f"=-MAX(0,{c}{row-2})*{c}{row-1}" for c in _YEAR_COLS])
         return ws
 
     def build_unlevered_fcf_sheet(self):
-        ws = self.wb.create_sheet("Unlevered_FCF")
-        self._setup_sheet(ws, "Unlevered_FCF")
+        ws = self._sheets.get("Unlevered_FCF")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "Unlevered Free Cash Flow")
 
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
-
-        ws.cell(row=row, column=1, value="EBIT")
-        for i in range(6):
-            col = i + 2
-            formula = f"=Taxes!{get_column_letter(col)}4"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="Less: Taxes")
-        for i in range(6):
-            col = i + 2
-            formula = f"=Taxes!{get_column_letter(col)}6"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="NOPAT")
-        for i in range(6):
-            col = i + 2
-            formula = f"={get_column_letter(col)}{row-2}+{get_column_letter(col)}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="Plus: D&A")
-        for i in range(6):
-            col = i + 2
-            formula = f"=-D&A!{get_column_letter(col)}3"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="Less: Capex")
-        for i in range(6):
-            col = i + 2
-            formula = f"=Capex!{get_column_letter(col)}3"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="Less: Change in NWC")
-        for i in range(6):
-            col = i + 2
-            formula = f"=Working_Capital!{get_column_letter(col)}3"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="Unlevered FCF")
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        for i in range(6):
-            col = i + 2
-            c = get_column_letter(col)
-            formula = f"={c}{row-4}+{c}{row-3}+{c}{row-2}+{c}{row-1}"
-            cell = self._add_formula_cell(ws, row, col, formula, '#,##0', bold=True)
-            cell.border = self.STYLES['border_bottom']
+        row = self._write_year_headers(ws, row)
+
+        row = self._write_formula_row(ws, row, "EBIT", [f"=Taxes!{c}4" for c in _YEAR_COLS])
+        row = self._write_formula_row(ws, row, "Less: Taxes", [f"=Taxes!{c}6" for c in _YEAR_COLS])
+        row = self._write_formula_row(ws, row, "NOPAT", [f"={c}{row-2}+{c}{row-1}" for c in _YEAR_COLS])
+        row = self._write_formula_row(ws, row, "Plus: D&A", [f"=-D&A!{c}5" for c in _YEAR_COLS])
+        row = self._write_formula_row(ws, row, "Less: Capex", [f"=Capex!{c}5" for c in _YEAR_COLS])
+        row = self._write_formula_row(ws, row, "Less: Change in NWC", [f"=Working_Capital!{c}5" for c in _YEAR_COLS])
+
+        # NOPAT + D&A + Capex + change in NWC (rows are contiguous)
+        self._write_formula_row(ws, row, "Unlevered FCF", [f"=SUM({c}{row-4}:{c}{row-1})" for c in _YEAR_COLS],
+                                bold=True)
+        ws.cell(row=row, column=1).font = _BOLD_FONT
+        for col in range(2, 8):
+            ws.cell(row=row, column=col).border = _BORDER_BOTTOM
         return ws
 
     def build_debt_schedule_sheet(self):
-        ws = self.wb.create_sheet("Debt_Schedule")
-        self._setup_sheet(ws, "Debt_Schedule")
-        row = 1
-        row = self._add_title(ws, row, "Debt Schedule")
-        ws.cell(row=row, column=1, value="(Placeholder for debt schedule)")
-        return ws
+        return self._build_placeholder_sheet("Debt_Schedule")
 
     def build_interest_expense_sheet(self):
-        ws = self.wb.create_sheet("Interest_Expense")
-        self._setup_sheet(ws, "Interest_Expense")
-        row = 1
-        row = self._add_title(ws, row, "Interest Expense")
-        ws.cell(row=row, column=1, value="(Placeholder for interest schedule)")
-        return ws
+        return self._build_placeholder_sheet("Interest_Expense")
 
     def build_share_count_sheet(self):
-        ws = self.wb.create_sheet("Share_Count")
-        self._setup_sheet(ws, "Share_Count")
-        row = 1
-        row = self._add_title(ws, row, "Share Count")
-        ws.cell(row=row, column=1, value="(Placeholder for share count schedule)")
-        return ws
+        return self._build_placeholder_sheet("Share_Count")
 
     def build_wacc_sheet(self):
         """Build the WACC tab"""
-        ws = self.wb.create_sheet("WACC")
-        self._setup_sheet(ws, "WACC")
+        ws = self._sheets.get("WACC")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "WACC Build")
 
-        row = self._add_section_header(ws, row, "WACC BUILDUP", 4)
-        wacc_inputs = [
-            ("Risk-Free Rate", self.a.risk_free_rate, '0.00%', 'rf_rate'),
-            ("Equity Risk Premium", self.a.equity_risk_premium, '0.00%', 'erp'),
-            ("Unlevered Beta", self._unlevered_beta, '0.00', 'unlevered_beta'),
-            ("Levered Beta", self._levered_beta, '0.00', 'beta'),
-            ("Size Premium", self._size_premium, '0.00%', 'size_prem'),
-            ("Company Risk Premium", self._company_specific_risk, '0.00%', 'co_risk'),
-            ("Pre-Tax Cost of Debt", self._cost_of_debt, '0.00%', 'cost_debt'),
-            ("Debt / Total Capital", self._debt_to_capital, '0.0%', 'debt_cap'),
-        ]
-        for label, value, fmt, name in wacc_inputs:
-            ws.cell(row=row, column=1, value=label)
-            self._add_input_cell(ws, row, 2, value, fmt, name)
-            row += 1
-
-        row += 1
-        ws.cell(row=row, column=1, value="Cost of Equity (CAPM + Adj)")
-        cost_equity_formula = f"={self._ref('rf_rate')}+{self._ref('beta')}*{self._ref('erp')}+{self._ref('size_prem')}+{self._ref('co_risk')}"
-        self._add_formula_cell(ws, row, 2, cost_equity_formula, '0.00%')
-        self._cell_refs['cost_equity'] = f"B{row}"
-        row += 1
-
-        ws.cell(row=row, column=1, value="After-Tax Cost of Debt")
-        atax_debt_formula = f"={self._ref('cost_debt')}*(1-Key_Assumptions!{self._ref('tax_rate')})"
-        self._add_formula_cell(ws, row, 2, atax_debt_formula, '0.00%')
-        self._cell_refs['atax_cost_debt'] = f"B{row}"
-        row += 1
-
-        ws.cell(row=row, column=1, value="WACC")
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        wacc_formula = f"={self._ref('cost_equity')}*(1-{self._ref('debt_cap')})+{self._ref('atax_cost_debt')}*{self._ref('debt_cap')}"
-        cell = self._add_formula_cell(ws, row, 2, wacc_formula, '0.00%', bold=True)
-        cell.fill = self.STYLES['output_fill']
-        cell.border = self.STYLES['border']
-        self._cell_refs['wacc'] = f"B{row}"
+        self._write_wacc_block(ws, row, tax_rate_sheet="Key_Assumptions")
         return ws
 
     def build_terminal_value_sheet(self):
-        ws = self.wb.create_sheet("Terminal_Value")
-        self._setup_sheet(ws, "Terminal_Value")
-        row = 1
-        row = self._add_title(ws, row, "Terminal Value")
-
-        ws.cell(row=row, column=1, value="Terminal Value (Gordon Growth)")
-        formula = f"=Unlevered_FCF!G10*(1+Key_Assumptions!{self._ref('term_growth')})/(WACC!{self._ref('wacc')}-Key_Assumptions!{self._ref('term_growth')})"
-        self._add_formula_cell(ws, row, 2, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="Terminal Value (Exit Multiple)")
-        formula = f"=EBITDA_Bridge!G6*Key_Assumptions!{self._ref('exit_mult')}"
-        self._add_formula_cell(ws, row, 2, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="PV of TV (Gordon)")
-        formula = f"=B2/(1+WACC!{self._ref('wacc')})^IF(Key_Assumptions!{self._ref('mid_year')}=1,5,5)"
-        self._add_formula_cell(ws, row, 2, formula, '#,##0')
-        row += 1
-
-        ws.cell(row=row, column=1, value="PV of TV (Exit Multiple)")
-        formula = f"=B3/(1+WACC!{self._ref('wacc')})^IF(Key_Assumptions!{self._ref('mid_year')}=1,5,5)"
-        self._add_formula_cell(ws, row, 2, formula, '#,##0')
+        ws = self._sheets.get("Terminal_Value")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
+        refs = self._refs
+        wacc = f"WACC!{refs.wacc}"
+        mid_year = f"Key_Assumptions!{refs.mid_year}"
+        gordon_tv = FORMULA_TEMPLATES["gordon_tv"].format(tg=f"Key_Assumptions!{refs.term_growth}", wacc=wacc)
+        exit_tv = FORMULA_TEMPLATES["exit_tv"].format(exit_mult=f"Key_Assumptions!{refs.exit_mult}")
+        pv_tv = FORMULA_TEMPLATES["pv_tv"]
+        self._write_cells(ws, [
+            (1, 1, "Terminal Value", _TITLE_FONT, None),
+            (3, 1, "Terminal Value (Gordon Growth)", None, None),
+            (3, 2, gordon_tv, _FORMULA_FONT, '#,##0'),
+            (4, 1, "Terminal Value (Exit Multiple)", None, None),
+            (4, 2, exit_tv, _FORMULA_FONT, '#,##0'),
+            (5, 1, "PV of TV (Gordon)", None, None),
+            (5, 2, pv_tv.format(tv="B3", wacc=wacc, mid_year=mid_year), _FORMULA_FONT, '#,##0'),
+            (6, 1, "PV of TV (Exit Multiple)", None, None),
+            (6, 2, pv_tv.format(tv="B4", wacc=wacc, mid_year=mid_year), _FORMULA_FONT, '#,##0'),
+        ])
         return ws
 
     def build_dcf_valuation_sheet(self):
         """Build the DCF Valuation tab"""
-        ws = self.wb.create_sheet("DCF_Valuation")
-        self._setup_sheet(ws, "DCF_Valuation")
+        ws = self._sheets.get("DCF_Valuation")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
 
         row = 1
         row = self._add_title(ws, row, "Discounted Cash Flow Valuation")
 
-        years = ["Base", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-        for i, year in enumerate(years):
-            cell = ws.cell(row=row, column=i+2, value=year)
-            cell.font = self.STYLES['header_font']
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
+        row = self._write_year_headers(ws, row)
 
-        ws.cell(row=row, column=1, value="Unlevered FCF")
-        for i in range(6):
-            col = i + 2
-            formula = f"=Unlevered_FCF!{get_column_letter(col)}10"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 2
+        # Cross-sheet links are formatted once per tab, not per formula
+        refs = self._refs
+        wacc = f"WACC!{refs.wacc}"
+        less_net_debt = FORMULA_TEMPLATES["less_net_debt"].format(net_debt=f"Key_Assumptions!{refs.net_debt}")
+        shares = f"Key_Assumptions!{refs.shares}"
+
+        fcf_row = row
+        row = self._write_formula_row(ws, row, "Unlevered FCF", [f"=Unlevered_FCF!{c}10" for c in _YEAR_COLS]) + 1
 
         # Discounting Section
         row = self._add_section_header(ws, row, "PRESENT VALUE CALCULATION", 8)
 
-        # Discount Period (with mid-year convention)
-        ws.cell(row=row, column=1, value="Discount Period")
-        for i in range(5):
-            col = i + 3
-            # Mid-year: 0.5, 1.5, 2.5... End-year: 1, 2, 3...
-            formula = f"=IF(Key_Assumptions!{self._ref('mid_year')}=1,{i}+0.5,{i+1})"
-            self._add_formula_cell(ws, row, col, formula, '0.0')
-        row += 1
+        # Discount Period (with mid-year convention), Years 1-5 in C-G
+        # Mid-year: 0.5, 1.5, 2.5... End-year: 1, 2, 3...
+        mid_year = f"Key_Assumptions!{refs.mid_year}"
+        row = self._write_formula_row(ws, row, "Discount Period", [
+            FORMULA_TEMPLATES["discount_period"].format(mid_year=mid_year, prior=year - 1, year=year)
+            for year in range(1, 6)], '0.0', column=3)
 
         # Discount Factor
-        ws.cell(row=row, column=1, value="Discount Factor")
-        for i in range(5):
-            col = i + 3
-            formula = f"=1/(1+WACC!{self._ref('wacc')})^{get_column_letter(col)}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '0.0000')
-        row += 1
+        discount_factor = FORMULA_TEMPLATES["discount_factor"]
+        row = self._write_formula_row(ws, row, "Discount Factor", [
+            discount_factor.format(wacc=wacc, period=f"{c}{row-1}") for c in _COL[3:8]], '0.0000', column=3)
 
         # PV of FCF
-        ws.cell(row=row, column=1, value="PV of FCF")
-        for i in range(5):
-            col = i + 3
-            formula = f"={get_column_letter(col)}3*{get_column_letter(col)}{row-1}"
-            self._add_formula_cell(ws, row, col, formula, '#,##0')
-        row += 2
+        pv_fcf = FORMULA_TEMPLATES["pv_fcf"]
+        row = self._write_formula_row(ws, row, "PV of FCF", [
+            pv_fcf.format(fcf=f"{c}{fcf_row}", factor=f"{c}{row-1}") for c in _COL[3:8]], column=3) + 1
 
         # Valuation Summary
         row = self._add_section_header(ws, row, "VALUATION SUMMARY", 4)
 
         # Sum of PV of FCFs
-        ws.cell(row=row, column=1, value="Sum of PV of FCFs")
+        ws.write(row, 1, "Sum of PV of FCFs")
         formula = f"=SUM(C{row-3}:G{row-3})"
         self._add_formula_cell(ws, row, 2, formula, '#,##0')
+        sum_pv_row = row
         row += 2
 
         # Gordon Growth Method
-        ws.cell(row=row, column=1, value="GORDON GROWTH METHOD")
-        ws.cell(row=row, column=1).font = Font(bold=True, italic=True)
+        ws.write(row, 1, "GORDON GROWTH METHOD")
+        ws.cell(row=row, column=1).font = _BOLD_ITALIC_FONT
         row += 1
 
-        ws.cell(row=row, column=1, value="Enterprise Value")
-        formula = f"=B{row-2}+Terminal_Value!B5"
+        ws.write(row, 1, "Enterprise Value")
+        formula = FORMULA_TEMPLATES["enterprise_value"].format(sum_pv=f"B{sum_pv_row}", pv_tv="Terminal_Value!B5")
         cell = self._add_formula_cell(ws, row, 2, formula, '#,##0', bold=True)
         row += 1
 
-        ws.cell(row=row, column=1, value="Less: Net Debt")
-        formula = f"=-Key_Assumptions!{self._ref('net_debt')}"
-        self._add_formula_cell(ws, row, 2, formula, '#,##0')
+        ws.write(row, 1, "Less: Net Debt")
+        self._add_formula_cell(ws, row, 2, less_net_debt, '#,##0')
         row += 1
 
-        ws.cell(row=row, column=1, value="Equity Value")
-        formula = f"=B{row-2}+B{row-1}"
-        cell = self._add_formula_cell(ws, row, 2, formula, '#,##0', bold=True)
-        cell.fill = self.STYLES['output_fill']
-        cell.border = self.STYLES['border']
+        ws.write(row, 1, "Equity Value")
+        formula = FORMULA_TEMPLATES["equity_value"].format(ev=f"B{row-2}", less_net_debt=f"B{row-1}")
+        self._add_output_cell(ws, row, 2, formula, '#,##0')
         row += 1
 
-        ws.cell(row=row, column=1, value="Implied Share Price")
-        formula = f"=B{row-1}/Key_Assumptions!{self._ref('shares')}"
-        cell = self._add_formula_cell(ws, row, 2, formula, '"$"#,##0.00', bold=True)
-        cell.fill = self.STYLES['output_fill']
-        cell.border = self.STYLES['border']
-        cell.font = Font(bold=True, size=12)
+        ws.write(row, 1, "Implied Share Price")
+        formula = FORMULA_TEMPLATES["share_price"].format(equity=f"B{row-1}", shares=shares)
+        self._add_output_cell(ws, row, 2, formula, '"$"#,##0.00', price=True)
         row += 2
 
         # Exit Multiple Method
-        ws.cell(row=row, column=1, value="EXIT MULTIPLE METHOD")
-        ws.cell(row=row, column=1).font = Font(bold=True, italic=True)
+        ws.write(row, 1, "EXIT MULTIPLE METHOD")
+        ws.cell(row=row, column=1).font = _BOLD_ITALIC_FONT
         row += 1
 
-        ws.cell(row=row, column=1, value="Enterprise Value")
-        formula = f"=B{row-7}+Terminal_Value!B6"
+        ws.write(row, 1, "Enterprise Value")
+        formula = FORMULA_TEMPLATES["enterprise_value"].format(sum_pv=f"B{sum_pv_row}", pv_tv="Terminal_Value!B6")
         cell = self._add_formula_cell(ws, row, 2, formula, '#,##0', bold=True)
         row += 1
 
-        ws.cell(row=row, column=1, value="Less: Net Debt")
-        formula = f"=-Key_Assumptions!{self._ref('net_debt')}"
-        self._add_formula_cell(ws, row, 2, formula, '#,##0')
+        ws.write(row, 1, "Less: Net Debt")
+        self._add_formula_cell(ws, row, 2, less_net_debt, '#,##0')
         row += 1
 
-        ws.cell(row=row, column=1, value="Equity Value")
-        formula = f"=B{row-2}+B{row-1}"
-        cell = self._add_formula_cell(ws, row, 2, formula, '#,##0', bold=True)
-        cell.fill = self.STYLES['output_fill']
-        cell.border = self.STYLES['border']
+        ws.write(row, 1, "Equity Value")
+        formula = FORMULA_TEMPLATES["equity_value"].format(ev=f"B{row-2}", less_net_debt=f"B{row-1}")
+        self._add_output_cell(ws, row, 2, formula, '#,##0')
         row += 1
 
-        ws.cell(row=row, column=1, value="Implied Share Price")
-        formula = f"=B{row-1}/Key_Assumptions!{self._ref('shares')}"
-        cell = self._add_formula_cell(ws, row, 2, formula, '"$"#,##0.00', bold=True)
-        cell.fill = self.STYLES['output_fill']
-        cell.border = self.STYLES['border']
-        cell.font = Font(bold=True, size=12)
+        ws.write(row, 1, "Implied Share Price")
+        formula = FORMULA_TEMPLATES["share_price"].format(equity=f"B{row-1}", shares=shares)
+        self._add_output_cell(ws, row, 2, formula, '"$"#,##0.00', price=True)
         return ws
 
     def build_ev_equity_bridge_sheet(self):
-        ws = self.wb.create_sheet("EV_Equity_Bridge")
-        self._setup_sheet(ws, "EV_Equity_Bridge")
-        row = 1
-        row = self._add_title(ws, row, "EV to Equity Bridge")
-
-        ws.cell(row=row, column=1, value="Enterprise Value (Gordon)")
-        ws.cell(row=row, column=2, value="=DCF_Valuation!B15").number_format = '#,##0'
-        row += 1
-        ws.cell(row=row, column=1, value="Less: Net Debt")
-        ws.cell(row=row, column=2, value=f"=-Key_Assumptions!{self._ref('net_debt')}").number_format = '#,##0'
-        row += 1
-        ws.cell(row=row, column=1, value="Equity Value")
-        ws.cell(row=row, column=2, value="=B3+B4").number_format = '#,##0'
-        row += 1
-        ws.cell(row=row, column=1, value="Implied Share Price")
-        ws.cell(row=row, column=2, value=f"=B5/Key_Assumptions!{self._ref('shares')}").number_format = '"$"#,##0.00'
+        ws = self._sheets.get("EV_Equity_Bridge")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
+        refs = self._refs
+        self._write_cells(ws, [
+            (1, 1, "EV to Equity Bridge", _TITLE_FONT, None),
+            (3, 1, "Enterprise Value (Gordon)", None, None),
+            (3, 2, "=DCF_Valuation!B15", None, '#,##0'),
+            (4, 1, "Less: Net Debt", None, None),
+            (4, 2, FORMULA_TEMPLATES["less_net_debt"].format(net_debt=f"Key_Assumptions!{refs.net_debt}"), None, '#,##0'),
+            (5, 1, "Equity Value", None, None),
+            (5, 2, FORMULA_TEMPLATES["equity_value"].format(ev="B3", less_net_debt="B4"), None, '#,##0'),
+            (6, 1, "Implied Share Price", None, None),
+            (6, 2, FORMULA_TEMPLATES["share_price"].format(equity="B5", shares=f"Key_Assumptions!{refs.shares}"),
+             None, '"$"#,##0.00'),
+        ])
         return ws
 
     def build_sensitivity_sheet(self):
         """Build sensitivity analysis with data tables"""
-        ws = self.wb.create_sheet("Sensitivity")
-        self._setup_sheet(ws, "Sensitivity")
+        ws = self._sheets.get("Sensitivity")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
 
         row = 1
-        ws.cell(row=row, column=1, value="Sensitivity Analysis")
-        ws.cell(row=row, column=1).font = self.STYLES['title_font']
+        ws.write(row, 1, "Sensitivity Analysis")
+        ws.cell(row=row, column=1).font = _TITLE_FONT
         row += 2
 
-        # WACC vs Terminal Growth (Gordon Growth)
-        row = self._add_section_header(ws, row, "SHARE PRICE: WACC vs TERMINAL GROWTH (Gordon Growth)", 9)
-        row += 1
-
-        # This would need VBA or manual data table setup
-        # For now, we'll create the structure
-        ws.cell(row=row, column=1, value="Terminal Growth →")
-        ws.cell(row=row, column=2, value="WACC ↓")
+        # Each grid cell is a live implied share price; {wacc} / {driver} are
+        # left in for _write_sensitivity_grid to fill with that cell's headers
+        refs = self._refs
+        price = FORMULA_TEMPLATES["sensitivity_price"]
+        links = dict(wacc="{wacc}", net_debt=f"Key_Assumptions!{refs.net_debt}", shares=f"Key_Assumptions!{refs.shares}")
+        gordon_price = price.format(tv=FORMULA_TEMPLATES["sensitivity_gordon_tv"], **links)
+        exit_price = price.format(tv=FORMULA_TEMPLATES["sensitivity_exit_tv"], **links)
 
-        # Terminal growth values across top
-        tg_values = [0.015, 0.020, 0.025, 0.030, 0.035]
-        for i, tg in enumerate(tg_values):
-            cell = ws.cell(row=row, column=i+3, value=tg)
-            cell.number_format = '0.0%'
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
-
-        # WACC values down left
         wacc_values = [0.08, 0.09, 0.10, 0.11, 0.12]
-        for wacc in wacc_values:
-            cell = ws.cell(row=row, column=2, value=wacc)
-            cell.number_format = '0.0%'
+        tg_values = [0.015, 0.020, 0.025, 0.030, 0.035]
+        mult_values = [8.0, 9.0, 10.0, 11.0, 12.0]
 
-            # Calculate implied share prices for each combination
-            for i, tg in enumerate(tg_values):
-                # This is a simplified calculation - real model would reference DCF sheet
-                # For MVP, showing structure
-                ws.cell(row=row, column=i+3, value="—")
-            row += 1
+        # WACC vs Terminal Growth (Gordon Growth)
+        row = self._add_section_header(ws, row, "SHARE PRICE: WACC vs TERMINAL GROWTH (Gordon Growth)", 9)
+        row += 1
+        row = self._write_sensitivity_grid(ws, row, "Terminal Growth →", tg_values, '0.0%',
+                                           wacc_values, gordon_price)
 
         row += 2
-        ws.cell(row=row, column=1, value="Note: Populate data table manually or via VBA")
-        ws.cell(row=row, column=1).font = Font(italic=True, color="808080")
+        ws.cell(row=row, column=1, value="Note: Implied share prices recalculate from the model; "
+                                         "discounting follows DCF_Valuation").font = _NOTE_FONT
         row += 2
 
         # WACC vs Exit Multiple
         row = self._add_section_header(ws, row, "SHARE PRICE: WACC vs EXIT MULTIPLE", 9)
         row += 1
+        self._write_sensitivity_grid(ws, row, "Exit Multiple →", mult_values, '0.0x',
+                                     wacc_values, exit_price)
 
-        ws.cell(row=row, column=1, value="Exit Multiple →")
-        ws.cell(row=row, column=2, value="WACC ↓")
-
-        mult_values = [8.0, 9.0, 10.0, 11.0, 12.0]
-        for i, mult in enumerate(mult_values):
-            cell = ws.cell(row=row, column=i+3, value=mult)
-            cell.number_format = '0.0x'
-            cell.alignment = Alignment(horizontal='center')
-        row += 1
+        return ws
 
+    def _write_sensitivity_grid(self, ws, row: int, driver_label: str, driver_values, driver_fmt: str,
+                                wacc_values, template: str) -> int:
+        """Driver values across (C..), WACC down column B, template filled per cell.
+
+        template takes {wacc} and {driver} as that cell's header refs. Returns
+        the row after the grid.
+        """
+        ws.write(row, 1, driver_label)
+        ws.write(row, 2, "WACC ↓")
+        put, center = ws.cell, _CENTER
+        for col, value in enumerate(driver_values, 3):
+            cell = put(row=row, column=col, value=value)
+            cell.number_format = driver_fmt
+            cell.alignment = center
+        header_row = row
+        row += 1
+
+        driver_cols = _COL[3:3 + len(driver_values)]
+        write_formula_row = self._write_formula_row
         for wacc in wacc_values:
-            cell = ws.cell(row=row, column=2, value=wacc)
-            cell.number_format = '0.0%'
-            for i in range(5):
-                ws.cell(row=row, column=i+3, value="—")
-            row += 1
-
-        return ws
+            put(row=row, column=2, value=wacc).number_format = '0.0%'
+            row = write_formula_row(ws, row, None, [
+                template.format(wacc=f"$B{row}", driver=f"{c}${header_row}") for c in driver_cols],
+                '"$"#,##0.00', column=3)
+        return row
 
     def build_scenario_manager_sheet(self):
-        ws = self.wb.create_sheet("Scenario_Manager")
-        self._setup_sheet(ws, "Scenario_Manager")
+        ws = self._sheets.get("Scenario_Manager")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
         row = 1
         row = self._add_title(ws, row, "Scenario Manager")
 
         row = self._add_section_header(ws, row, "DEAL CASE (REALISTIC CABLE TARGET)", 5)
-        ws.cell(row=row, column=1, value="Buyer")
-        ws.cell(row=row, column=2, value="Comcast (CMCSA)")
-        row += 1
-        ws.cell(row=row, column=1, value="Target")
-        ws.cell(row=row, column=2, value="Altice USA (ATUS)")
-        row += 1
-        ws.cell(row=row, column=1, value="Deal Type")
-        ws.cell(row=row, column=2, value="Strategic Acquisition")
-        row += 1
-        ws.cell(row=row, column=1, value="Purchase Premium")
-        self._add_input_cell(ws, row, 2, 0.30, '0.0%')
-        row += 1
-        ws.cell(row=row, column=1, value="LTM EV/EBITDA Multiple")
-        self._add_input_cell(ws, row, 2, 7.5, '0.0x')
-        row += 1
-        ws.cell(row=row, column=1, value="Synergies (Run-Rate, $M)")
-        self._add_input_cell(ws, row, 2, 300, '#,##0')
-        row += 1
-        ws.cell(row=row, column=1, value="Funding Mix (Debt / Equity)")
-        ws.cell(row=row, column=2, value="60% / 40%")
+        self._write_label_rows(ws, row, self.SCENARIO_ROWS)
 
         return ws
 
     def build_kpi_dashboard_sheet(self):
-        ws = self.wb.create_sheet("KPI_Dashboard")
-        self._setup_sheet(ws, "KPI_Dashboard")
-        row = 1
-        row = self._add_title(ws, row, "KPI Dashboard")
-        ws.cell(row=row, column=1, value="Implied Share Price (Gordon)")
-        ws.cell(row=row, column=2, value="=DCF_Valuation!B18").number_format = '"$"#,##0.00'
-        row += 1
-        ws.cell(row=row, column=1, value="Implied Share Price (Exit)")
-        ws.cell(row=row, column=2, value="=DCF_Valuation!B24").number_format = '"$"#,##0.00'
+        ws = self._sheets.get("KPI_Dashboard")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
+        self._write_cells(ws, [
+            (1, 1, "KPI Dashboard", _TITLE_FONT, None),
+            (3, 1, "Implied Share Price (Gordon)", None, None),
+            (3, 2, "=DCF_Valuation!B18", None, '"$"#,##0.00'),
+            (4, 1, "Implied Share Price (Exit)", None, None),
+            (4, 2, "=DCF_Valuation!B24", None, '"$"#,##0.00'),
+        ])
         return ws
 
     def build_trading_comps_sheet(self):
-        ws = self.wb.create_sheet("Trading_Comps")
-        self._setup_sheet(ws, "Trading_Comps")
-        row = 1
-        row = self._add_title(ws, row, "Trading Comps")
-        ws.cell(row=row, column=1, value="(Placeholder for trading comps)")
-        return ws
+        return self._build_placeholder_sheet("Trading_Comps")
 
     def build_transactions_comps_sheet(self):
-        ws = self.wb.create_sheet("Transactions_Comps")
-        self._setup_sheet(ws, "Transactions_Comps")
-        row = 1
-        row = self._add_title(ws, row, "Transactions Comps")
-        ws.cell(row=row, column=1, value="(Placeholder for transactions comps)")
-        return ws
+        return self._build_placeholder_sheet("Transactions_Comps")
 
     def build_charts_checks_sheet(self):
         """Build error checking dashboard"""
-        ws = self.wb.create_sheet("Charts_Checks")
-        self._setup_sheet(ws, "Charts_Checks")
+        ws = self._sheets.get("Charts_Checks")
+        if ws is None:  # Tab not enabled
+            return None
+        self._setup_sheet(ws)
 
         row = 1
         row = self._add_title(ws, row, "Charts & Model Integrity Checks")
 
-        checks = [
-            ("WACC > Terminal Growth", f"=IF(WACC!{self._ref('wacc')}>Key_Assumptions!{self._ref('term_growth')},\"PASS\",\"FAIL\")", "Terminal growth must be less than WACC"),
-            ("WACC is Reasonable (5-15%)", f"=IF(AND(WACC!{self._ref('wacc')}>=0.05,WACC!{self._ref('wacc')}<=0.15),\"PASS\",\"WARNING\")", "WACC typically ranges 5-15%"),
-            ("Terminal Growth ≤ 4%", f"=IF(Key_Assumptions!{self._ref('term_growth')}<=0.04,\"PASS\",\"WARNING\")", "Should not exceed long-term GDP growth"),
-            ("Positive Base Revenue", f"=IF(Key_Assumptions!{self._ref('base_revenue')}>0,\"PASS\",\"FAIL\")", "Revenue must be positive"),
-            ("Shares Outstanding > 0", f"=IF(Key_Assumptions!{self._ref('shares')}>0,\"PASS\",\"FAIL\")", "Shares must be positive"),
-        ]
-
         row = self._add_section_header(ws, row, "VALIDATION CHECKS", 5)
 
-        ws.cell(row=row, column=1, value="Check")
-        ws.cell(row=row, column=2, value="Status")
-        ws.cell(row=row, column=3, value="Description")
-        ws.cell(row=row, column=1).font = self.STYLES['header_font']
-        ws.cell(row=row, column=2).font = self.STYLES['header_font']
-        ws.cell(row=row, column=3).font = self.STYLES['header_font']
-        row += 1
-
-        for check_name, formula, description in checks:
-            ws.cell(row=row, column=1, value=check_name)
-            cell = ws.cell(row=row, column=2, value=formula)
-            cell.border = self.STYLES['border']
-            ws.cell(row=row, column=3, value=description)
+        ws.write(row, 1, "Check")
+        ws.write(row, 2, "Status")
+        ws.write(row, 3, "Description")
+        ws.cell(row=row, column=1).font = _HEADER_FONT
+        ws.cell(row=row, column=2).font = _HEADER_FONT
+        ws.cell(row=row, column=3).font = _HEADER_FONT
+        row += 1
+
+        refs = self._refs
+        links = {
+            "wacc": f"WACC!{refs.wacc}",
+            "tg": f"Key_Assumptions!{refs.term_growth}",
+            "base_revenue": f"Key_Assumptions!{refs.base_revenue}",
+            "shares": f"Key_Assumptions!{refs.shares}",
+        }
+        for check_name, template, description in self.CHECK_ROWS:
+            status = WriteOnlyCell(ws.ws, template.format_map(links))
+            status.border = _BORDER
+            ws.write_row(row, 1, (check_name, status, description))
             row += 1
 
         return ws
 
     def generate(self, output_path: str):
         """Generate the complete DCF model"""
-        self.build_cover_sheet()
-        self.build_contents_sheet()
-        self.build_key_assumptions_sheet()
-        self.build_historical_sheets()
-        self.build_revenue_build_sheet()
-        self.build_cogs_gross_margin_sheet()
-        self.build_opex_sheet()
-        self.build_ebitda_bridge_sheet()
-        self.build_da_sheet()
-        self.build_capex_sheet()
-        self.build_working_capital_sheet()
-        self.build_other_operating_sheet()
-        self.build_taxes_sheet()
-        self.build_unlevered_fcf_sheet()
-        self.build_debt_schedule_sheet()
-        self.build_interest_expense_sheet()
-        self.build_share_count_sheet()
-        self.build_wacc_sheet()
-        self.build_inputs_index_sheet()
-        self.build_dcf_valuation_sheet()
-        self.build_terminal_value_sheet()
-        self.build_ev_equity_bridge_sheet()
-        self.build_sensitivity_sheet()
-        self.build_scenario_manager_sheet()
-        self.build_kpi_dashboard_sheet()
-        self.build_trading_comps_sheet()
-        self.build_transactions_comps_sheet()
-        self.build_charts_checks_sheet()
-
-        self.wb._sheets.sort(key=lambda s: self.TAB_ORDER.index(s.title))
-
-        # Set Cover as the active sheet
-        self.wb.active = self.wb["Cover"]
+        # Phase 1: tabs that register the cell refs other tabs link to
+        # (WACC re-registers the WACC inputs, so it follows Key_Assumptions)
+        ref_builders = (
+            self.build_key_assumptions_sheet,
+            self.build_wacc_sheet,
+        )
+        # Phase 2: every other tab only reads _refs, so these builds are
+        # independent of each other and can run in any order. They stay on
+        # one thread: styling a cell registers its font/fill/border in the
+        # workbook's shared style tables, which are not thread-safe, and the
+        # row building itself is pure Python under the GIL
+        builders = (
+            self.build_cover_sheet,
+            self.build_contents_sheet,
+            self.build_inputs_index_sheet,
+            self.build_historical_sheets,
+            self.build_revenue_build_sheet,
+            self.build_cogs_gross_margin_sheet,
+            self.build_opex_sheet,
+            self.build_ebitda_bridge_sheet,
+            self.build_da_sheet,
+            self.build_capex_sheet,
+            self.build_working_capital_sheet,
+            self.build_other_operating_sheet,
+            self.build_taxes_sheet,
+            self.build_unlevered_fcf_sheet,
+            self.build_debt_schedule_sheet,
+            self.build_interest_expense_sheet,
+            self.build_share_count_sheet,
+            self.build_dcf_valuation_sheet,
+            self.build_terminal_value_sheet,
+            self.build_ev_equity_bridge_sheet,
+            self.build_sensitivity_sheet,
+            self.build_scenario_manager_sheet,
+            self.build_kpi_dashboard_sheet,
+            self.build_trading_comps_sheet,
+            self.build_transactions_comps_sheet,
+            self.build_charts_checks_sheet,
+        )
+
+        # Each tab is streamed to its write-only sheet as soon as it is built
+        # rather than holding every tab's rows until save. Sheets were created
+        # in TAB_ORDER, so build order does not affect tab order
+        for build in ref_builders + builders:
+            ws = build()
+            if isinstance(ws, _SheetBuffer):
+                self._emit(ws)
+
+        # Builders that fill several tabs (Historical_*) leave them to here
+        for ws in self._sheets.values():
+            self._emit(ws)
+
+        self._save(output_path)
+        return output_path
+
+    def _emit(self, ws: _SheetBuffer):
+        """Write a built tab's buffered rows out (a no-op once they have been)"""
+        ws.flush()
 
+    def _save(self, output_path: str):
         self.wb.save(output_path)
-        return output_path
 
 
-def generate_dcf_model(assumptions: DCFAssumptions, output_path: str) -> str:
-    """Convenience function to generate DCF model"""
-    model = ProfessionalDCFModel(assumptions)
-    return model.generate(output_path)
+# Excel writer backends generate_dcf_model can emit with
+WRITERS = ("openpyxl", "xlsxwriter", "xml")
+
+
+def generate_dcf_model(assumptions: DCFAssumptions, output_path: str, writer: str = "openpyxl",
+                       enabled_sheets: Optional[Iterable[str]] = None) -> List[str]:
+    """Convenience function to generate DCF model; returns the tabs written, in order"""
+    if writer not in WRITERS:
+        raise ValueError(f"Unsupported writer {writer!r}; expected one of {WRITERS}")
+    if writer == "xlsxwriter":
+        from models.dcf_xlsxwriter import ProfessionalDCFModelXW  # Optional dependency
+        model = ProfessionalDCFModelXW(assumptions, enabled_sheets=enabled_sheets)
+    elif writer == "xml":
+        from models.dcf_xml import ProfessionalDCFModelXML
+        model = ProfessionalDCFModelXML(assumptions, enabled_sheets=enabled_sheets)
+    else:
+        model = ProfessionalDCFModel(assumptions, enabled_sheets=enabled_sheets)
+    model.generate(output_path)
+    return model.sheetnames
 
 
 if __name__ == "__main__":
@@ -1095,5 +1223,6 @@ if __name__ == "__main__":
         shares_outstanding=100
     )
 
-    output = generate_dcf_model(assumptions, "test_professional_dcf.xlsx")
+    output = "test_professional_dcf.xlsx"
+    generate_dcf_model(assumptions, output)
     print(f"Generated: {output}")
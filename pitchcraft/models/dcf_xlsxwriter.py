@@ -0,0 +1,109 @@
+"""
+xlsxwriter backend for the Professional DCF Model
+Same tabs and builders; rows are written with xlsxwriter in constant_memory mode
+"""
+
+import xlsxwriter
+from openpyxl.cell import Cell
+from models.dcf_professional import ProfessionalDCFModel
+
+# openpyxl border side style -> xlsxwriter border index
+_BORDER_STYLES = {"thin": 1, "medium": 2, "dashed": 3, "dotted": 4, "thick": 5, "double": 6, "hair": 7}
+
+
+def _color(color) -> str:
+    """openpyxl ARGB color -> xlsxwriter '#RRGGBB' (None when unset or themed)"""
+    rgb = getattr(color, "rgb", None)
+    return f"#{rgb[-6:]}" if isinstance(rgb, str) else None
+
+
+class ProfessionalDCFModelXW(ProfessionalDCFModel):
+    """ProfessionalDCFModel written out with xlsxwriter instead of openpyxl.
+
+    The builders are shared: they still fill the openpyxl row buffers (whose
+    workbook is never saved), and each buffered tab is written here row by
+    row, in ascending order as constant_memory requires.
+    """
+
+    def generate(self, output_path: str):
+        self._xw = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'use_zip64': False})
+        self._xw_sheets = {name: self._xw.add_worksheet(name) for name in self._sheets}
+        self._formats = {}  # openpyxl style array -> xlsxwriter Format
+        return super().generate(output_path)
+
+    def _format(self, cell: Cell):
+        """xlsxwriter Format equivalent to an openpyxl cell's style, cached per style combination"""
+        key = tuple(cell._style)
+        fmt = self._formats.get(key, False)
+        if fmt is not False:
+            return fmt
+
+        props = {}
+        font = cell.font
+        if font.b:
+            props['bold'] = True
+        if font.i:
+            props['italic'] = True
+        if font.sz:
+            props['font_size'] = font.sz
+        if _color(font.color):
+            props['font_color'] = _color(font.color)
+
+        fill = cell.fill
+        if getattr(fill, "fill_type", None) == "solid" and _color(fill.fgColor):
+            props['pattern'] = 1
+            props['bg_color'] = _color(fill.fgColor)
+
+        border = cell.border
+        for side in ("left", "right", "top", "bottom"):
+            edge = getattr(border, side)
+            if edge is not None and edge.style:
+                props[side] = _BORDER_STYLES.get(edge.style, 1)
+
+        if cell.alignment.horizontal:
+            props['align'] = cell.alignment.horizontal
+        if cell.number_format != 'General':
+            props['num_format'] = cell.number_format
+
+        fmt = self._formats[key] = self._xw.add_format(props) if props else None
+        return fmt
+
+    def _emit(self, ws):
+        """Write a built tab's buffered rows with xlsxwriter"""
+        if not ws.max_row:
+            return
+        sheet = self._xw_sheets[ws.title]
+        rows = list(ws.rows())
+
+        # xlsxwriter has no default column width, so apply it to the used columns
+        default_width = ws.sheet_format.defaultColWidth
+        if default_width:
+            sheet.set_column(0, max(len(values) for _, values in rows) - 1, default_width)
+        for letter, dim in ws.column_dimensions.items():
+            if dim.width:
+                sheet.set_column(f"{letter}:{letter}", dim.width)
+
+        # Merged ranges: first row -> first col -> (last row, last col), all 1-based
+        merges = {}
+        for rng in ws.ws.merged_cells.ranges:
+            min_col, min_row, max_col, max_row = rng.bounds
+            merges.setdefault(min_row, {})[min_col] = (max_row, max_col)
+
+        fmt_of = self._format
+        for r, values in rows:
+            merged = merges.get(r, {})
+            for c, value in enumerate(values, 1):
+                fmt = None
+                if isinstance(value, Cell):
+                    fmt = fmt_of(value)
+                    value = value.value
+                if c in merged:
+                    last_row, last_col = merged[c]
+                    sheet.merge_range(r - 1, c - 1, last_row - 1, last_col - 1, value, fmt)
+                elif value is not None:
+                    sheet.write(r - 1, c - 1, value, fmt)
+                elif fmt is not None:
+                    sheet.write_blank(r - 1, c - 1, None, fmt)
+
+    def _save(self, output_path: str):
+        self._xw.close()
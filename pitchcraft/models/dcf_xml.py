@@ -0,0 +1,181 @@
+"""
+Direct-XML backend for the Professional DCF Model
+Same tabs and builders; sheet rows are serialized straight to SpreadsheetML
+"""
+
+import re
+import threading
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
+from xml.sax.saxutils import escape
+from openpyxl.cell import Cell
+from openpyxl.xml.constants import ARC_CORE
+from openpyxl.xml.functions import tostring
+from models.dcf_professional import ProfessionalDCFModel, _COL
+
+# Enabled tab layout -> _CachedLayout from the first model rendered with it.
+# Shared by every model in the process; /api/generate builds models on
+# threadpool threads, so entries are added and dropped under a lock
+_LAYOUTS = {}
+_LAYOUTS_LOCK = threading.Lock()
+_MAX_LAYOUTS = 16  # Oldest layout is dropped beyond this
+
+# The empty sheetData openpyxl leaves in each sheet part; written as a start/end
+# pair by the stdlib serializer, possibly self-closed when openpyxl uses lxml
+_EMPTY_SHEET_DATA = re.compile(rb"<sheetData\s*/>|<sheetData>\s*</sheetData>")
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedLayout:
+    """What one full render of a tab layout leaves for later models to reuse"""
+    parts: dict  # Package part name -> bytes, sheetData empty
+    sheet_titles: dict  # Sheet part name -> tab title
+    static_rows: dict  # Tab title -> <row> elements, for tabs outside ASSUMPTION_TABS
+    styles: tuple  # _style_tables() of the workbook the parts and rows came from
+
+
+def _style_tables(wb) -> tuple:
+    """The tables a cell's style id resolves through in styles.xml, in registration order"""
+    return (
+        tuple(map(tuple, wb._cell_styles)),  # StyleArrays are mutable; snapshot them
+        tuple(wb._fonts),
+        tuple(wb._fills),
+        tuple(wb._borders),
+        tuple(wb._alignments),
+        tuple(wb._protections),
+        tuple(wb._number_formats),
+        tuple(style.name for style in wb._named_styles),
+    )
+
+
+def _styles_extend(cached: tuple, wb) -> bool:
+    """Whether each of wb's style tables is a prefix of the cached one, i.e. every
+    style id wb has handed out means the same style in the cached styles.xml"""
+    return all(len(current) <= len(full) and current == full[:len(current)]
+               for current, full in zip(_style_tables(wb), cached))
+
+
+def _cell_xml(ref: str, value, style_id: int) -> str:
+    """One <c> element; strings are written inline, as openpyxl does"""
+    s = f' s="{style_id}"' if style_id else ""
+    if value is None:
+        return f'<c r="{ref}"{s}/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{s} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{s} t="n"><v>{value:.16g}</v></c>'  # Same precision as openpyxl
+    text = str(value)
+    if text.startswith("="):
+        return f'<c r="{ref}"{s}><f>{escape(text[1:])}</f><v/></c>'
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}"{s} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+
+def _fill_sheet_data(data: bytes, rows: str, part_name: str) -> bytes:
+    """A sheet part from the shell with rows written into its empty sheetData"""
+    filled = b"<sheetData>" + rows.encode("utf-8") + b"</sheetData>"
+    data, found = _EMPTY_SHEET_DATA.subn(lambda _: filled, data, count=1)
+    if not found:
+        raise RuntimeError(f"No empty <sheetData> in {part_name} to write rows into")
+    return data
+
+
+class ProfessionalDCFModelXML(ProfessionalDCFModel):
+    """ProfessionalDCFModel with sheet rows serialized directly to XML.
+
+    openpyxl writes the workbook shell (styles, workbook, column widths,
+    merges) with empty sheetData, once per tab layout; each tab's rows are
+    formatted here with f-strings and spliced into its sheet part on save.
+    Only ASSUMPTION_TABS differ between models with the same layout, so after
+    the first such model the other tabs' rows are reused rather than rebuilt.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._layout = tuple(self._sheets)
+        self._sheet_data = {}  # title -> <row> elements
+        self._cached = None  # _CachedLayout this model's non-assumption tabs come from
+
+    def generate(self, output_path: str):
+        cached = _LAYOUTS.get(self._layout)
+        if cached is None:
+            return super().generate(output_path)
+
+        # Builders skip tabs missing from _sheets, so only the assumption tabs
+        # are built; the other tabs' rows, and their style ids, are the cached ones
+        self._cached = cached
+        self._sheet_data.update(cached.static_rows)
+        self._sheets = {name: ws for name, ws in self._sheets.items() if name in self.ASSUMPTION_TABS}
+        super().generate(output_path)
+        if self._cached is not None:
+            return output_path
+
+        # The assumption tabs registered styles differently from the model the
+        # cache came from, so the cached style ids would point at the wrong
+        # styles. Drop the entry and build every tab on a fresh model, which
+        # renders (and caches) its own shell
+        with _LAYOUTS_LOCK:
+            if _LAYOUTS.get(self._layout) is cached:
+                del _LAYOUTS[self._layout]
+        return ProfessionalDCFModel.generate(type(self)(self.a, enabled_sheets=self._layout), output_path)
+
+    def _emit(self, ws):
+        """Serialize a built tab's buffered rows (a no-op once they have been)"""
+        parts = []
+        for r, values in ws.rows():
+            cells = []
+            for c, value in enumerate(values, 1):
+                if isinstance(value, Cell):
+                    # style_id registers the cell's style with the workbook
+                    cells.append(_cell_xml(f"{_COL[c]}{r}", value.value, value.style_id))
+                elif value is not None:
+                    cells.append(_cell_xml(f"{_COL[c]}{r}", value, 0))
+            parts.append(f'<row r="{r}">{"".join(cells)}</row>')
+        if parts:
+            self._sheet_data[ws.title] = "".join(parts)
+
+    def _save(self, output_path: str):
+        cached = self._cached
+        if cached is None:
+            parts, sheet_titles = self._render_shell()
+        elif _styles_extend(cached.styles, self.wb):
+            parts, sheet_titles = cached.parts, cached.sheet_titles
+        else:
+            self._cached = None  # Nothing written; generate() starts over
+            return
+        sheet_data = self._sheet_data
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as out:
+            for name, data in parts.items():
+                if name == ARC_CORE:
+                    # Document properties (created/modified times) belong to this workbook
+                    data = tostring(self.wb.properties.to_tree())
+                rows = sheet_data.get(sheet_titles.get(name))
+                if rows:
+                    data = _fill_sheet_data(data, rows, name)
+                out.writestr(name, data)
+
+    def _render_shell(self):
+        """Package parts openpyxl writes around the rows, cached with this model's
+        static tab rows and style tables for later models with the same layout.
+
+        Everything outside sheetData (styles, workbook, column widths, merges)
+        depends only on which tabs are enabled and which styles were registered;
+        a later model reuses it only if its own style ids agree (see _save).
+        Returns ({part name: bytes}, {sheet part: title}).
+        """
+        buf = BytesIO()
+        self.wb.save(buf)
+        with zipfile.ZipFile(buf) as src:
+            parts = {name: src.read(name) for name in src.namelist()}
+        # Sheet part names are assigned during save
+        sheet_titles = {ws.path.lstrip("/"): ws.title for ws in self.wb.worksheets}
+        static_rows = {title: rows for title, rows in self._sheet_data.items()
+                       if title not in self.ASSUMPTION_TABS}
+        with _LAYOUTS_LOCK:
+            if self._layout not in _LAYOUTS:  # Another thread may have rendered it meanwhile
+                if len(_LAYOUTS) >= _MAX_LAYOUTS:
+                    del _LAYOUTS[next(iter(_LAYOUTS))]
+                _LAYOUTS[self._layout] = _CachedLayout(parts, sheet_titles, static_rows,
+                                                       _style_tables(self.wb))
+        return parts, sheet_titles
@@ -3,52 +3,165 @@ PitchCraftAI Web API
 FastAPI backend for the demo
 """
 
+import asyncio
 import os
+import secrets
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 import json
+import orjson
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project root to path. data/core/models are imported as top-level
+# packages everywhere (main.py, run.py, the models), so this stays; it is only
+# skipped when the entry point already put the root on the path
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from data.sec_fetcher import fetch_company, CompanyFinancials
 from core.question_generator import QuestionGenerator, DCFAssumptions
-from models.dcf_professional import generate_dcf_model, ProfessionalDCFModel
-from openpyxl import load_workbook
+from core.dcf_kernel import project
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, which formats the float-heavy payloads in C.
+    (fastapi.responses.ORJSONResponse is deprecated in newer FastAPI releases.)
+
+    Handlers whose payloads are already plain JSON types return one directly:
+    FastAPI then skips jsonable_encoder, whose walk over every key of every
+    question/validation row costs far more than rendering them."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
 
 app = FastAPI(
     title="PitchCraftAI",
     description="AI-Powered DCF Model Generator for Investment Banking",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS for local development
+# CORS for local development (run.py ports); the bundled UI is same-origin and
+# needs none. Other front-end hosts: comma-separated PITCHCRAFT_CORS_ORIGINS
+CORS_ORIGINS = [origin.strip() for origin in os.environ.get(
+    "PITCHCRAFT_CORS_ORIGINS", "http://localhost:8000,http://localhost:8001").split(",") if origin.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=24 * 60 * 60,  # Let browsers cache preflight responses for a day
 )
 
+
+class _GZipExceptDownloads(GZipMiddleware):
+    """GZipMiddleware that passes /api/download/ through untouched: the
+    workbooks it serves are zip archives already"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/download/"):
+            await self.app(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+
+# Float-heavy JSON (and index.html) compress several-fold; tiny responses aren't worth it
+app.add_middleware(_GZipExceptDownloads, minimum_size=1024)
+
 # Output directory for generated files
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-# Cache for fetched company data
-_company_cache: Dict[str, CompanyFinancials] = {}
+MEDIA_XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Generated workbooks are deleted after this long (checked at most once a
+# minute, when a new one is generated)
+OUTPUT_TTL = 60 * 60  # seconds
+_OUTPUT_SWEEP_INTERVAL = 60
+_last_output_sweep = 0.0
+
+
+class _TTLCache:
+    """Bounded mapping whose entries expire ttl seconds after being stored;
+    once full, the least recently used entry is evicted"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()  # key -> (expires at, value)
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+# Cache for fetched company data; filings change rarely, but not never
+_company_cache = _TTLCache(maxsize=128, ttl=60 * 60)
+
+# /api/company payloads: ticker -> (financials they were built from, payload)
+_payload_cache = _TTLCache(maxsize=128, ttl=60 * 60)
+
+
+async def _get_financials(ticker: str) -> CompanyFinancials:
+    """Cached financials for a ticker, fetched from SEC on a miss (404 if unavailable)"""
+    financials = _company_cache.get(ticker)
+    if financials is None:
+        # Blocking HTTP; run it in the threadpool so the event loop keeps serving
+        financials = await run_in_threadpool(fetch_company, ticker)
+        if not financials:
+            raise HTTPException(status_code=404, detail=f"Could not fetch data for {ticker}")
+        _company_cache[ticker] = financials
+    return financials
+
+
+def _sweep_output_dir():
+    """Delete generated workbooks older than OUTPUT_TTL (at most once per sweep interval)"""
+    global _last_output_sweep
+    now = time.time()
+    if now - _last_output_sweep < _OUTPUT_SWEEP_INTERVAL:
+        return
+    _last_output_sweep = now
+    for path in OUTPUT_DIR.glob("*.xlsx"):
+        try:
+            if now - path.stat().st_mtime > OUTPUT_TTL:
+                path.unlink()
+        except OSError:
+            pass  # Already gone, or in use
 
 
 class CompanyRequest(BaseModel):
     ticker: str
 
 
+class CompanyBatchRequest(BaseModel):
+    tickers: List[str]
+
+
 class GenerateRequest(BaseModel):
     ticker: str
     assumptions: Dict[str, Any]
@@ -67,19 +180,12 @@ async def get_companies():
     return {"companies": DEMO_COMPANIES}
 
 
-@app.get("/api/company/{ticker}")
-async def get_company_data(ticker: str):
-    """Fetch live company data from SEC"""
-    ticker = ticker.upper()
-
-    # Check cache first
-    if ticker in _company_cache:
-        financials = _company_cache[ticker]
-    else:
-        financials = fetch_company(ticker)
-        if not financials:
-            raise HTTPException(status_code=404, detail=f"Could not fetch data for {ticker}")
-        _company_cache[ticker] = financials
+def _company_payload(financials: CompanyFinancials) -> Dict[str, Any]:
+    """Company, financials, questions and defaults as returned by /api/company.
+    Built once per fetched CompanyFinancials and reused until it is refetched."""
+    cached = _payload_cache.get(financials.ticker)
+    if cached is not None and cached[0] is financials:
+        return cached[1]
 
     # Generate questions with intelligent defaults
     generator = QuestionGenerator(financials)
@@ -87,7 +193,7 @@ async def get_company_data(ticker: str):
     defaults = generator.get_defaults()
 
     # Format response
-    return {
+    payload = {
         "company": {
             "ticker": financials.ticker,
             "name": financials.name,
@@ -120,88 +226,77 @@ async def get_company_data(ticker: str):
         ],
         "defaults": defaults,
     }
+    _payload_cache[financials.ticker] = (financials, payload)
+    return payload
+
+
+@app.get("/api/company/{ticker}")
+async def get_company_data(ticker: str):
+    """Fetch live company data from SEC"""
+    ticker = ticker.upper()
+    financials = await _get_financials(ticker)
+    return ORJSONResponse(_company_payload(financials))
+
+
+# Most tickers one /api/companies/batch call will look up
+MAX_BATCH_TICKERS = 20
+
+
+@app.post("/api/companies/batch")
+async def get_companies_batch(request: CompanyBatchRequest):
+    """/api/company payloads for several tickers in one call, fetched concurrently.
+    Tickers that can't be fetched or parsed map to null."""
+    tickers = list(dict.fromkeys(t.upper() for t in request.tickers))  # Dedupe, keep order
+    if len(tickers) > MAX_BATCH_TICKERS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_TICKERS} tickers per batch")
+
+    async def payload(ticker: str) -> Optional[Dict[str, Any]]:
+        try:
+            return _company_payload(await _get_financials(ticker))
+        except HTTPException:  # Unknown ticker or no SEC data
+            return None
+        except Exception as e:  # One bad filing shouldn't fail the whole batch
+            print(f"Error building payload for {ticker}: {e}")
+            return None
+
+    return ORJSONResponse(dict(zip(tickers, await asyncio.gather(*map(payload, tickers)))))
 
 
 @app.post("/api/generate")
 async def generate_dcf(request: GenerateRequest):
     """Generate DCF model with provided assumptions"""
-    import time
     start_time = time.time()
 
     ticker = request.ticker.upper()
-
-    # Get cached financials or fetch
-    if ticker not in _company_cache:
-        financials = fetch_company(ticker)
-        if not financials:
-            raise HTTPException(status_code=404, detail=f"Could not fetch data for {ticker}")
-        _company_cache[ticker] = financials
-    else:
-        financials = _company_cache[ticker]
+    financials = await _get_financials(ticker)
 
     # Create assumptions from provided values
     generator = QuestionGenerator(financials)
     assumptions = generator.create_assumptions_from_answers(request.assumptions)
 
-    # Generate model
-    output_filename = f"{ticker.lower()}_dcf_{int(os.urandom(4).hex(), 16)}.xlsx"
+    # Generate model (openpyxl is only imported once a model is requested)
+    from models.dcf_professional import generate_dcf_model, ProfessionalDCFModel
+
+    output_filename = f"{ticker.lower()}_dcf_{secrets.token_hex(4)}.xlsx"
     output_path = OUTPUT_DIR / output_filename
+    _sweep_output_dir()
 
-    generate_dcf_model(assumptions, str(output_path))
+    # Tabs come back from the generator, so the workbook is never reopened.
+    # Building and saving is synchronous, so keep it off the event loop
+    sheetnames = await run_in_threadpool(generate_dcf_model, assumptions, str(output_path))
 
     # Verify generated workbook tabs for UI + integrity
-    wb = load_workbook(str(output_path), read_only=True)
-    sheetnames = wb.sheetnames
-    expected_tabs = getattr(ProfessionalDCFModel, "TAB_ORDER", [
-        "Cover",
-        "Contents",
-        "Inputs_Index",
-        "Key_Assumptions",
-        "Historical_IS",
-        "Historical_BS",
-        "Historical_CF",
-        "Revenue_Build",
-        "COGS_Gross_Margin",
-        "Opex",
-        "EBITDA_Bridge",
-        "D&A",
-        "Capex",
-        "Working_Capital",
-        "Other_Operating",
-        "Taxes",
-        "Unlevered_FCF",
-        "Debt_Schedule",
-        "Interest_Expense",
-        "Share_Count",
-        "WACC",
-        "DCF_Valuation",
-        "Terminal_Value",
-        "EV_Equity_Bridge",
-        "Sensitivity",
-        "Scenario_Manager",
-        "KPI_Dashboard",
-        "Trading_Comps",
-        "Transactions_Comps",
-        "Charts_Checks",
-    ])
-    missing_tabs = [t for t in expected_tabs if t not in sheetnames]
+    written = set(sheetnames)
+    missing_tabs = [t for t in ProfessionalDCFModel.TAB_ORDER if t not in written]
 
     generation_time = time.time() - start_time
 
     # Calculate model outputs for display
-    # WACC with full buildup: relever beta, then CAPM + size + specific risk
-    levered_beta = assumptions.unlevered_beta * (1 + (1 - assumptions.tax_rate) * assumptions.target_debt_to_equity)
-    cost_of_equity = (assumptions.risk_free_rate +
-                      levered_beta * assumptions.equity_risk_premium +
-                      assumptions.size_premium +
-                      assumptions.company_specific_risk)
-    after_tax_cost_of_debt = assumptions.pre_tax_cost_of_debt * (1 - assumptions.tax_rate)
-    debt_weight = assumptions.target_debt_to_equity / (1 + assumptions.target_debt_to_equity)
-    equity_weight = 1 - debt_weight
-    wacc = equity_weight * cost_of_equity + debt_weight * after_tax_cost_of_debt
+    # WACC and its buildup come from the assumptions, same as the workbook inputs
+    wacc = assumptions.wacc
+    debt_weight = assumptions.debt_weight
 
     # Build projection data for in-browser display
-    revenues = [assumptions.base_revenue]
     growth_rates = [
         assumptions.revenue_growth_y1,
         assumptions.revenue_growth_y2,
@@ -209,15 +304,6 @@ async def generate_dcf(request: GenerateRequest):
         assumptions.revenue_growth_y4,
         assumptions.revenue_growth_y5,
     ]
-    for g in growth_rates:
-        revenues.append(revenues[-1] * (1 + g))
-
-    # EBITDA with margin expansion/contraction
-    base_margin = assumptions.ebitda_margin
-    terminal_margin = assumptions.ebitda_margin_y5
-    margin_delta = (terminal_margin - base_margin) / 5
-    margins = [base_margin + margin_delta * i for i in range(6)]
-    ebitdas = [r * m for r, m in zip(revenues, margins)]
 
     # FCF calculation with detailed working capital
     # NWC = (DSO/365 * Rev) + (DIO/365 * COGS) - (DPO/365 * COGS)
@@ -225,40 +311,31 @@ async def generate_dcf(request: GenerateRequest):
     ccc = assumptions.days_sales_outstanding + assumptions.days_inventory_outstanding - assumptions.days_payables_outstanding
     nwc_pct = ccc / 365  # Convert days to % of revenue
 
-    fcfs = []
-    for i, rev in enumerate(revenues):
-        ebitda = ebitdas[i]
-        da = rev * assumptions.da_pct_revenue
-        ebit = ebitda - da
-        nopat = ebit * (1 - assumptions.tax_rate)
-        capex = rev * assumptions.capex_pct_revenue
-
-        if i == 0:
-            nwc_change = 0
-        else:
-            nwc_change = (revenues[i] - revenues[i-1]) * nwc_pct
-
-        fcf = nopat + da - capex - nwc_change
-        fcfs.append(fcf)
-
-    # DCF valuation
-    pv_fcfs = []
-    for i in range(1, 6):
-        discount_period = i - 0.5 if assumptions.use_mid_year_convention else i
-        df = 1 / (1 + wacc) ** discount_period
-        pv_fcfs.append(fcfs[i] * df)
-
-    sum_pv_fcf = sum(pv_fcfs)
-
-    # Terminal values
-    tv_gordon = fcfs[5] * (1 + assumptions.terminal_growth) / (wacc - assumptions.terminal_growth)
-    tv_exit = ebitdas[5] * assumptions.exit_ebitda_multiple
-
-    pv_tv_gordon = tv_gordon / (1 + wacc) ** 5
-    pv_tv_exit = tv_exit / (1 + wacc) ** 5
-
-    ev_gordon = sum_pv_fcf + pv_tv_gordon
-    ev_exit = sum_pv_fcf + pv_tv_exit
+    projection = project(
+        base_revenue=assumptions.base_revenue,
+        growth_rates=growth_rates,
+        base_margin=assumptions.ebitda_margin,
+        terminal_margin=assumptions.ebitda_margin_y5,
+        da_pct=assumptions.da_pct_revenue,
+        capex_pct=assumptions.capex_pct_revenue,
+        tax_rate=assumptions.tax_rate,
+        nwc_pct=nwc_pct,
+        wacc=wacc,
+        terminal_growth=assumptions.terminal_growth,
+        exit_multiple=assumptions.exit_ebitda_multiple,
+        mid_year=assumptions.use_mid_year_convention,
+    )
+    revenues = projection.revenues
+    ebitdas = projection.ebitdas
+    fcfs = projection.fcfs
+    pv_fcfs = projection.pv_fcfs
+
+    tv_gordon = projection.tv_gordon
+    tv_exit = projection.tv_exit
+    pv_tv_gordon = projection.pv_tv_gordon
+    pv_tv_exit = projection.pv_tv_exit
+    ev_gordon = projection.ev_gordon
+    ev_exit = projection.ev_exit
 
     # EV to Equity bridge with full adjustments
     net_debt = assumptions.total_debt - assumptions.cash
@@ -310,7 +387,7 @@ async def generate_dcf(request: GenerateRequest):
 
     vp_pass = all(v["status"] == "pass" for v in validations)
 
-    return {
+    return ORJSONResponse({
         "success": True,
         "filename": output_filename,
         "download_url": f"/api/download/{output_filename}",
@@ -340,15 +417,15 @@ async def generate_dcf(request: GenerateRequest):
         "wacc_buildup": {
             "risk_free_rate": assumptions.risk_free_rate,
             "unlevered_beta": assumptions.unlevered_beta,
-            "levered_beta": levered_beta,
+            "levered_beta": assumptions.levered_beta,
             "equity_risk_premium": assumptions.equity_risk_premium,
             "size_premium": assumptions.size_premium,
             "company_specific_risk": assumptions.company_specific_risk,
-            "cost_of_equity": cost_of_equity,
+            "cost_of_equity": assumptions.cost_of_equity,
             "pre_tax_cost_of_debt": assumptions.pre_tax_cost_of_debt,
-            "after_tax_cost_of_debt": after_tax_cost_of_debt,
+            "after_tax_cost_of_debt": assumptions.after_tax_cost_of_debt,
             "debt_weight": debt_weight,
-            "equity_weight": equity_weight,
+            "equity_weight": 1 - debt_weight,
             "wacc": wacc,
         },
         "valuation": {
@@ -383,20 +460,23 @@ async def generate_dcf(request: GenerateRequest):
             "net_debt": net_debt,
             "shares_outstanding": assumptions.shares_outstanding,
         }
-    }
+    })
 
 
 @app.get("/api/download/{filename}")
 async def download_file(filename: str):
     """Download generated Excel file"""
     file_path = OUTPUT_DIR / filename
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()  # Handed to FileResponse so it doesn't stat again
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
 
     return FileResponse(
         path=str(file_path),
         filename=filename,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        media_type=MEDIA_XLSX,
+        stat_result=stat_result,
     )
 
 
@@ -4,19 +4,33 @@ Start PitchCraftAI web server
 """
 
 import uvicorn
-import webbrowser
 import threading
-import time
 import sys
 from pathlib import Path
 
 # Ensure repo root is on path so pitchcraft package resolves
 sys.path.insert(0, str(Path(__file__).parent))
 
+from pitchcraft.web.api import app
+
+# Set once uvicorn has bound its socket and finished app startup
+server_ready = threading.Event()
+
+
+class BrowserServer(uvicorn.Server):
+    """uvicorn server that signals server_ready after startup"""
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if self.started:  # False if startup failed (e.g. port in use)
+            server_ready.set()
+
+
 def open_browser():
-    """Open browser after server starts"""
-    time.sleep(1.5)
-    webbrowser.open("http://localhost:8001")
+    """Open browser as soon as the server is up"""
+    import webbrowser
+    if server_ready.wait(timeout=30):
+        webbrowser.open("http://localhost:8001")
 
 if __name__ == "__main__":
     print("""
@@ -32,10 +46,13 @@ if __name__ == "__main__":
     threading.Thread(target=open_browser, daemon=True).start()
 
     # Start server
-    uvicorn.run(
-        "pitchcraft.web.api:app",
+    config = uvicorn.Config(
+        app,
         host="0.0.0.0",
         port=8001,
-        reload=False,
+        loop="auto",  # uvloop / httptools when installed, asyncio / h11 otherwise
+        http="auto",
+        workers=1,
         log_level="info"
     )
+    BrowserServer(config).run()
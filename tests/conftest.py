@@ -0,0 +1,30 @@
+"""Shared fixtures. Modules import data/core/models as top-level packages,
+as main.py and run.py arrange, so put pitchcraft/ on the path."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pitchcraft"))
+
+from data.sec_fetcher import CompanyFinancials  # noqa: E402
+from core.question_generator import QuestionGenerator  # noqa: E402
+
+
+@pytest.fixture
+def financials() -> CompanyFinancials:
+    return CompanyFinancials(
+        ticker="TEST", name="Test Corp", cik="0000000001",
+        revenue=[800.0, 900.0, 1000.0], revenue_years=[2022, 2023, 2024],
+        ebitda=[200.0, 230.0, 260.0], net_income=[100.0, 110.0, 120.0],
+        total_assets=5000.0, total_debt=700.0, cash=200.0, shares_outstanding=100.0,
+        ebitda_margin=0.26, revenue_growth=[0.125, 1000 / 900 - 1],
+        avg_revenue_growth=(0.125 + 1000 / 900 - 1) / 2,
+    )
+
+
+@pytest.fixture
+def assumptions(financials):
+    generator = QuestionGenerator(financials)
+    return generator.create_assumptions_from_answers(generator.get_defaults())
@@ -0,0 +1,76 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import web.api as api
+
+
+@pytest.fixture
+def client(financials, monkeypatch, tmp_path):
+    """API client whose SEC fetches return the test company (TEST) or nothing"""
+    monkeypatch.setattr(api, "fetch_company", lambda ticker: financials if ticker == "TEST" else None)
+    monkeypatch.setattr(api, "_company_cache", api._TTLCache(maxsize=128, ttl=60))
+    monkeypatch.setattr(api, "_payload_cache", api._TTLCache(maxsize=128, ttl=60))
+    monkeypatch.setattr(api, "OUTPUT_DIR", tmp_path)
+    return TestClient(api.app)
+
+
+def test_json_responses_are_gzipped(client):
+    response = client.get("/api/company/test", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["company"]["ticker"] == "TEST"
+
+
+def test_downloads_are_not_recompressed(client, tmp_path):
+    workbook = tmp_path / "test_dcf.xlsx"
+    workbook.write_bytes(b"PK\x03\x04" + bytes(4096))
+    response = client.get("/api/download/test_dcf.xlsx", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-type"] == api.MEDIA_XLSX
+    assert response.content == workbook.read_bytes()
+
+
+def test_batch_returns_payloads_in_request_order(client):
+    response = client.post("/api/companies/batch", json={"tickers": ["test", "NOPE", "TEST"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body) == ["TEST", "NOPE"]
+    assert body["TEST"] == client.get("/api/company/TEST").json()
+    assert body["NOPE"] is None
+
+
+def test_batch_maps_failed_fetches_to_null(client, financials, monkeypatch):
+    def fetch(ticker):
+        if ticker == "BROKEN":
+            raise KeyError("units")
+        return financials if ticker == "TEST" else None
+
+    monkeypatch.setattr(api, "fetch_company", fetch)
+    response = client.post("/api/companies/batch", json={"tickers": ["BROKEN", "TEST"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["BROKEN"] is None
+    assert body["TEST"]["company"]["ticker"] == "TEST"
+
+
+def test_batch_rejects_too_many_tickers(client):
+    tickers = [f"T{i}" for i in range(api.MAX_BATCH_TICKERS + 1)]
+    assert client.post("/api/companies/batch", json={"tickers": tickers}).status_code == 400
+
+
+def test_generate_reports_the_assumptions_wacc_buildup(client, financials):
+    answers = {"target_debt_to_equity": 0.5, "size_premium": 0.02, "tax_rate": 0.25}
+    response = client.post("/api/generate", json={"ticker": "TEST", "assumptions": answers})
+    assert response.status_code == 200
+    buildup = response.json()["wacc_buildup"]
+
+    assumptions = api.QuestionGenerator(financials).create_assumptions_from_answers(answers)
+    assert buildup["wacc"] == assumptions.wacc
+    assert buildup["levered_beta"] == assumptions.levered_beta
+    assert buildup["cost_of_equity"] == assumptions.cost_of_equity
+    assert buildup["after_tax_cost_of_debt"] == assumptions.after_tax_cost_of_debt
+    assert buildup["debt_weight"] + buildup["equity_weight"] == pytest.approx(1)
+    assert buildup["wacc"] == pytest.approx(
+        buildup["equity_weight"] * buildup["cost_of_equity"]
+        + buildup["debt_weight"] * buildup["after_tax_cost_of_debt"])
@@ -0,0 +1,54 @@
+import pytest
+
+from core.dcf_kernel import project
+
+
+def _baseline(base_revenue, growth_rates, base_margin, terminal_margin, da_pct, capex_pct,
+              tax_rate, nwc_pct, wacc, terminal_growth, exit_multiple, mid_year):
+    """The step-by-step projection /api/generate did inline before the kernel existed"""
+    revenues = [base_revenue]
+    for g in growth_rates:
+        revenues.append(revenues[-1] * (1 + g))
+
+    margin_delta = (terminal_margin - base_margin) / 5
+    margins = [base_margin + margin_delta * i for i in range(6)]
+    ebitdas = [r * m for r, m in zip(revenues, margins)]
+
+    fcfs = []
+    for i, rev in enumerate(revenues):
+        da = rev * da_pct
+        nopat = (ebitdas[i] - da) * (1 - tax_rate)
+        nwc_change = 0 if i == 0 else (revenues[i] - revenues[i - 1]) * nwc_pct
+        fcfs.append(nopat + da - rev * capex_pct - nwc_change)
+
+    pv_fcfs = [fcfs[i] / (1 + wacc) ** (i - 0.5 if mid_year else i) for i in range(1, 6)]
+    tv_gordon = fcfs[5] * (1 + terminal_growth) / (wacc - terminal_growth)
+    tv_exit = ebitdas[5] * exit_multiple
+    pv_tv_gordon = tv_gordon / (1 + wacc) ** 5
+    pv_tv_exit = tv_exit / (1 + wacc) ** 5
+    return {
+        "revenues": revenues, "ebitdas": ebitdas, "fcfs": fcfs, "pv_fcfs": pv_fcfs,
+        "tv_gordon": tv_gordon, "tv_exit": tv_exit,
+        "pv_tv_gordon": pv_tv_gordon, "pv_tv_exit": pv_tv_exit,
+        "ev_gordon": sum(pv_fcfs) + pv_tv_gordon, "ev_exit": sum(pv_fcfs) + pv_tv_exit,
+    }
+
+
+CASES = [
+    dict(base_revenue=1000.0, growth_rates=[0.12, 0.10, 0.08, 0.06, 0.04], base_margin=0.25,
+         terminal_margin=0.28, da_pct=0.04, capex_pct=0.05, tax_rate=0.24, nwc_pct=25 / 365,
+         wacc=0.09, terminal_growth=0.025, exit_multiple=12.0, mid_year=True),
+    dict(base_revenue=52_345.6, growth_rates=[-0.05, 0.0, 0.03, 0.2, -0.1], base_margin=0.4,
+         terminal_margin=0.3, da_pct=0.08, capex_pct=0.02, tax_rate=0.0, nwc_pct=-0.05,
+         wacc=0.14, terminal_growth=0.0, exit_multiple=6.5, mid_year=False),
+    dict(base_revenue=0.0, growth_rates=[0.5] * 5, base_margin=0.1, terminal_margin=0.1,
+         da_pct=0.01, capex_pct=0.01, tax_rate=0.35, nwc_pct=0.0, wacc=0.06,
+         terminal_growth=0.04, exit_multiple=20.0, mid_year=True),
+]
+
+
+@pytest.mark.parametrize("inputs", CASES)
+def test_project_matches_baseline(inputs):
+    result = project(**inputs)
+    for name, expected in _baseline(**inputs).items():
+        assert getattr(result, name) == pytest.approx(expected, rel=1e-12, abs=1e-9), name
@@ -0,0 +1,47 @@
+import re
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from models.dcf_professional import ProfessionalDCFModel, _SheetBuffer, generate_dcf_model
+
+
+def test_enabled_sheets_always_include_ref_tabs(assumptions, tmp_path):
+    path = tmp_path / "subset.xlsx"
+    tabs = generate_dcf_model(assumptions, str(path), enabled_sheets={"Revenue_Build", "Cover"})
+    assert tabs == ["Cover", "Key_Assumptions", "Revenue_Build", "WACC"]
+
+    ws = load_workbook(path)["Revenue_Build"]
+    formulas = [c.value for row in ws.iter_rows() for c in row if isinstance(c.value, str) and c.value.startswith("=")]
+    assert formulas
+    assert not [f for f in formulas if re.search(r"!(?![$A-Z])", f)]  # Sheet ref without a cell
+    assert ws["B5"].value == "=Key_Assumptions!B8"
+
+
+def test_enabled_sheets_rejects_unknown_tabs(assumptions):
+    with pytest.raises(ValueError, match="Revenue_Bild"):
+        ProfessionalDCFModel(assumptions, enabled_sheets=["Cover", "Revenue_Bild"])
+
+
+def test_default_builds_every_tab(assumptions, tmp_path):
+    tabs = generate_dcf_model(assumptions, str(tmp_path / "full.xlsx"))
+    assert tabs == ProfessionalDCFModel.TAB_ORDER
+
+
+def test_sheet_buffer_tracks_max_row():
+    buffer = _SheetBuffer(Workbook(write_only=True).create_sheet("Test"))
+    assert buffer.max_row == 0
+    buffer.write(3, 1, "a")
+    buffer.cell(2, 1, "b")
+    assert buffer.max_row == 3
+    buffer.append(["c", None, "d"])
+    buffer.write_row(5, 2, ["e"])
+    assert buffer.max_row == 5
+    assert [r for r, _ in buffer.rows()] == [1, 2, 3, 4, 5]
+    assert buffer.max_row == 0
+
+
+def test_sheet_buffer_merge_cells():
+    buffer = _SheetBuffer(Workbook(write_only=True).create_sheet("Test"))
+    buffer.merge_cells(start_row=2, start_column=1, end_row=2, end_column=8)
+    assert [str(r) for r in buffer.ws.merged_cells.ranges] == ["A2:H2"]
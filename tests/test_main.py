@@ -0,0 +1,59 @@
+import pytest
+
+import main
+from core.question_generator import QuestionGenerator
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("10", 0.10),
+    ("10%", 0.10),
+    ("0.10", 0.10),
+    (" 10 % ", 0.10),
+    ("+5", 0.05),
+    ("-5", -0.05),
+    ("-2.5 %", -0.025),
+    ("0.5%", 0.005),
+    ("0.5", 0.5),
+    (".25", 0.25),
+    ("1e-2", 0.01),
+    ("2.5E1", 0.25),
+    ("1", 1.0),
+])
+def test_parse_percent(text, expected):
+    assert main.parse_percent(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", ["", "%", "ten", "10%%", "1,000", "5-", "--5", "0x10"])
+def test_parse_percent_rejects(text):
+    with pytest.raises(ValueError):
+        main.parse_percent(text)
+
+
+def test_interactive_mode_reprompts_on_invalid_input(financials, monkeypatch, capsys):
+    generator = QuestionGenerator(financials)
+    questions = generator.generate_questions()
+    # First question: an invalid reply, then 12%. Second: above its max. Rest: defaults
+    feed = iter(["abc", "12", "90"] + [""] * len(questions))
+    monkeypatch.setattr("builtins.input", lambda prompt: next(feed))
+    answers = main.interactive_mode(generator)
+
+    assert answers[questions[0].id] == pytest.approx(0.12)
+    assert answers[questions[1].id] == questions[1].bounds[1]
+    assert answers[questions[2].id] == questions[2].default_value
+    out = capsys.readouterr().out
+    assert "Not a number" in out
+    assert "out of range" in out
+
+
+@pytest.mark.parametrize("reply", ["nan", "inf", "-inf", "NaN%", "1e999"])
+def test_interactive_mode_rejects_non_finite_numbers(financials, monkeypatch, capsys, reply):
+    generator = QuestionGenerator(financials)
+    questions = generator.generate_questions()
+    number_index = next(i for i, q in enumerate(questions) if q.value_type == "number")
+    # Defaults up to the first number question, then a non-finite reply, then 40
+    feed = iter([""] * number_index + [reply, "40"] + [""] * len(questions))
+    monkeypatch.setattr("builtins.input", lambda prompt: next(feed))
+    answers = main.interactive_mode(generator)
+
+    assert answers[questions[number_index].id] == 40.0
+    assert "Not a number" in capsys.readouterr().out
@@ -0,0 +1,39 @@
+import dataclasses
+from itertools import groupby
+from operator import attrgetter
+
+from core.question_generator import DCFAssumptions, QuestionGenerator
+
+
+def test_answers_land_in_their_own_fields(financials):
+    generator = QuestionGenerator(financials)
+    questions = generator.generate_questions()
+    # A distinct value per question, so a value put in the wrong field shows up
+    answers = {q.id: 1000.0 + i for i, q in enumerate(questions)}
+    assumptions = generator.create_assumptions_from_answers(answers)
+
+    for qid, value in answers.items():
+        assert getattr(assumptions, qid) == value, qid
+    assert assumptions.company_name == financials.name
+    assert assumptions.base_revenue == financials.revenue[-1]
+    assert assumptions.total_debt == financials.total_debt
+    assert assumptions.cash == financials.cash
+    assert assumptions.shares_outstanding == financials.shares_outstanding
+    assert assumptions.other_working_capital_pct == 0.02
+    assert assumptions.preferred_stock == 0
+
+
+def test_unanswered_questions_use_defaults(financials):
+    generator = QuestionGenerator(financials)
+    defaults = generator.get_defaults()
+    assumptions = generator.create_assumptions_from_answers({"tax_rate": 0.3})
+    assert assumptions.tax_rate == 0.3
+    assert assumptions.terminal_growth == defaults["terminal_growth"]
+    assert {f.name for f in dataclasses.fields(DCFAssumptions)} >= set(defaults)
+
+
+def test_categories_and_subcategories_are_contiguous(financials):
+    questions = QuestionGenerator(financials).generate_questions()
+    for key in (attrgetter("category"), attrgetter("category", "subcategory")):
+        groups = [k for k, _ in groupby(questions, key=key)]
+        assert len(groups) == len(set(groups)), groups
@@ -0,0 +1,61 @@
+import gzip
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import data.sec_fetcher as sec_fetcher
+
+
+def test_each_thread_gets_its_own_session(monkeypatch):
+    monkeypatch.setattr(sec_fetcher.SECFetcher, "_load_ticker_map", lambda self: None)
+    fetcher = sec_fetcher.SECFetcher()
+    assert fetcher._session is fetcher._session
+    assert fetcher._session.headers["User-Agent"] == sec_fetcher.SECFetcher.HEADERS["User-Agent"]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        sessions = list(pool.map(lambda _: fetcher._session, range(2)))
+    assert fetcher._session not in sessions
+
+
+def _write_body(cache_dir, name, size, age, now):
+    body = cache_dir / f"{name}.json.gz"
+    body.write_bytes(bytes(size))
+    (cache_dir / f"{name}.etag").write_text('"v1"')
+    os.utime(body, (now - age, now - age))
+    return body
+
+
+def test_prune_facts_cache_by_age_and_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(sec_fetcher, "_FACTS_CACHE_DIR", tmp_path)
+    now = time.time()
+    fresh = _write_body(tmp_path, "CIK1", 100, 10, now)
+    older = _write_body(tmp_path, "CIK2", 100, 20, now)
+    oldest = _write_body(tmp_path, "CIK3", 100, 30, now)
+    expired = _write_body(tmp_path, "CIK4", 10, sec_fetcher._FACTS_CACHE_MAX_AGE + 1, now)
+    leftover = tmp_path / "CIK5.json.gz.abc.tmp"
+    leftover.write_bytes(b"partial")
+    os.utime(leftover, (now - sec_fetcher._TMP_MAX_AGE - 1,) * 2)
+
+    sec_fetcher.SECFetcher._prune_facts_cache()
+    assert not expired.exists() and not leftover.exists()
+    assert fresh.exists() and older.exists() and oldest.exists()
+
+    monkeypatch.setattr(sec_fetcher, "_FACTS_CACHE_MAX_BYTES", 250)
+    sec_fetcher.SECFetcher._prune_facts_cache()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "CIK1.etag", "CIK1.json.gz", "CIK2.etag", "CIK2.json.gz"]
+
+
+def test_facts_cache_writes_from_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(sec_fetcher, "_FACTS_CACHE_DIR", tmp_path)
+    body_path, etag_path = tmp_path / "CIK1.json.gz", tmp_path / "CIK1.etag"
+    contents = [json.dumps({"entityName": f"Corp {i}"}).encode() for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda content: sec_fetcher.SECFetcher._write_facts_cache(
+            body_path, etag_path, content, '"v1"'), contents))
+
+    with gzip.open(body_path, "rb") as f:
+        assert f.read() in contents
+    assert etag_path.read_text() == '"v1"'
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+from openpyxl import load_workbook
+
+import models.dcf_xml as dcf_xml
+from models.dcf_professional import ProfessionalDCFModel, generate_dcf_model
+
+
+def _cell_signature(cell):
+    """Value and the formatting the builders set, normalised across writers"""
+    font = cell.font
+    color = font.color.rgb if font.color is not None else None
+    return (
+        cell.value,
+        cell.number_format,
+        bool(font.b),
+        bool(font.i),
+        font.sz if font.sz != 11 else None,  # xlsxwriter states the default size
+        color[-6:] if isinstance(color, str) else None,
+        cell.fill.fgColor.rgb[-6:] if cell.fill.fill_type else None,
+        getattr(cell.border.left, "style", None),
+        getattr(cell.border.bottom, "style", None),
+        cell.alignment.horizontal,
+    )
+
+
+def _workbook_contents(path):
+    wb = load_workbook(path)
+    return {
+        ws.title: (
+            {cell.coordinate: _cell_signature(cell) for row in ws.iter_rows() for cell in row
+             if cell.value is not None or cell.has_style},
+            sorted(map(str, ws.merged_cells.ranges)),
+        )
+        for ws in wb.worksheets
+    }
+
+
+@pytest.mark.parametrize("writer", ["xlsxwriter", "xml"])
+def test_writers_match_openpyxl(assumptions, tmp_path, writer):
+    if writer == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    expected = tmp_path / "openpyxl.xlsx"
+    actual = tmp_path / f"{writer}.xlsx"
+    assert generate_dcf_model(assumptions, str(expected)) == ProfessionalDCFModel.TAB_ORDER
+    assert generate_dcf_model(assumptions, str(actual), writer=writer) == ProfessionalDCFModel.TAB_ORDER
+
+    expected_contents = _workbook_contents(expected)
+    actual_contents = _workbook_contents(actual)
+    assert list(actual_contents) == list(expected_contents)
+    for title, (cells, merges) in expected_contents.items():
+        assert actual_contents[title][1] == merges, title
+        # xlsxwriter writes styled blanks that openpyxl drops; compare cells with values
+        actual_cells = actual_contents[title][0]
+        for ref, signature in cells.items():
+            if signature[0] is not None:
+                assert actual_cells.get(ref) == signature, f"{title}!{ref}"
+        assert {ref for ref, sig in actual_cells.items() if sig[0] is not None} == \
+               {ref for ref, sig in cells.items() if sig[0] is not None}, title
+
+
+@pytest.fixture(autouse=True)
+def empty_layout_cache(monkeypatch):
+    """Each test starts without shells cached by earlier ones"""
+    monkeypatch.setattr(dcf_xml, "_LAYOUTS", {})
+
+
+@pytest.mark.parametrize("empty", [b"<sheetData/>", b"<sheetData></sheetData>", b"<sheetData>\n</sheetData>"])
+def test_fill_sheet_data_accepts_either_empty_form(empty):
+    part = b'<worksheet><sheetFormatPr/>' + empty + b'<pageMargins/></worksheet>'
+    rows = '<row r="1"><c r="A1" t="n"><v>1</v></c></row>'
+    assert dcf_xml._fill_sheet_data(part, rows, "xl/worksheets/sheet1.xml") == \
+        b'<worksheet><sheetFormatPr/><sheetData>' + rows.encode() + b'</sheetData><pageMargins/></worksheet>'
+
+
+def test_fill_sheet_data_raises_without_empty_sheet_data():
+    with pytest.raises(RuntimeError, match="sheet1.xml"):
+        dcf_xml._fill_sheet_data(b"<worksheet/>", '<row r="1"/>', "xl/worksheets/sheet1.xml")
+
+
+def test_xml_writer_reuses_shell_with_own_document_properties(assumptions, tmp_path):
+    created = []
+    for year in (2020, 2021):
+        model = dcf_xml.ProfessionalDCFModelXML(assumptions)
+        model.wb.properties.created = datetime(year, 1, 2, 3, 4, 5)
+        path = tmp_path / f"{year}.xlsx"
+        model.generate(str(path))
+        created.append(load_workbook(path).properties.created)
+    assert len(dcf_xml._LAYOUTS) == 1
+    assert created == [datetime(2020, 1, 2, 3, 4, 5), datetime(2021, 1, 2, 3, 4, 5)]
+
+
+def test_xml_writer_from_several_threads(assumptions, tmp_path):
+    expected = tmp_path / "openpyxl.xlsx"
+    generate_dcf_model(assumptions, str(expected))
+    paths = [tmp_path / f"xml_{i}.xlsx" for i in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda path: generate_dcf_model(assumptions, str(path), writer="xml"), paths))
+    expected_contents = _workbook_contents(expected)
+    for path in paths:
+        assert _workbook_contents(path) == expected_contents
+    assert len(dcf_xml._LAYOUTS) == 1
+
+
+def test_xml_writer_layout_cache_survives_other_layouts(assumptions, tmp_path):
+    expected = tmp_path / "openpyxl.xlsx"
+    generate_dcf_model(assumptions, str(expected))
+    expected_contents = _workbook_contents(expected)
+
+    generate_dcf_model(assumptions, str(tmp_path / "full_1.xlsx"), writer="xml")
+    generate_dcf_model(assumptions, str(tmp_path / "subset.xlsx"), writer="xml",
+                       enabled_sheets={"Cover", "Sensitivity", "Charts_Checks"})
+    generate_dcf_model(assumptions, str(tmp_path / "full_2.xlsx"), writer="xml")
+
+    assert len(dcf_xml._LAYOUTS) == 2
+    assert _workbook_contents(tmp_path / "full_1.xlsx") == expected_contents
+    assert _workbook_contents(tmp_path / "full_2.xlsx") == expected_contents
+
+
+def test_xml_writer_rebuilds_when_style_ids_drift(assumptions, tmp_path):
+    expected = tmp_path / "openpyxl.xlsx"
+    generate_dcf_model(assumptions, str(expected))
+    generate_dcf_model(assumptions, str(tmp_path / "first.xlsx"), writer="xml")
+
+    # A cache whose style tables registered fonts in another order than this model will
+    (layout, cached), = dcf_xml._LAYOUTS.items()
+    styles = list(cached.styles)
+    styles[1] = styles[1][::-1]
+    dcf_xml._LAYOUTS[layout] = drifted = dcf_xml._CachedLayout(
+        cached.parts, cached.sheet_titles, cached.static_rows, tuple(styles))
+
+    path = tmp_path / "second.xlsx"
+    generate_dcf_model(assumptions, str(path), writer="xml")
+    assert _workbook_contents(path) == _workbook_contents(expected)
+    assert dcf_xml._LAYOUTS[layout] is not drifted